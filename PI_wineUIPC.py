@@ -2,6 +2,8 @@
 import importlib
 
 _impl = importlib.import_module("PythonPlugins.wineUIPC.main")
+# einmal beim Import auflösen – main.py muss keinen Message-Handler haben
+_recv = getattr(_impl, "XPluginReceiveMessage", None)
 
 class PythonInterface:
     def XPluginStart(self):
@@ -18,8 +20,5 @@ class PythonInterface:
         _impl.XPluginDisable()
 
     def XPluginReceiveMessage(self, inFromWho, inMessage, inParam):
-        # optional: falls du später Messages brauchst
-        try:
-            _impl.XPluginReceiveMessage(inFromWho, inMessage, inParam)  # existiert bei dir nicht – einfach ignorieren
-        except AttributeError:
-            pass
+        if _recv is not None:
+            _recv(inFromWho, inMessage, inParam)
@@ -0,0 +1,102 @@
+import importlib.util
+import json
+import os
+import shutil
+import socket
+import struct
+import sys
+import threading
+import types
+
+import pytest
+
+MAIN_PY = os.path.join(os.path.dirname(__file__), os.pardir, "wineUIPC", "main.py")
+
+
+@pytest.fixture(scope="module")
+def main(tmp_path_factory):
+    # Kopie in ein leeres Verzeichnis: keine wineUIPC.cfg → Defaults (log_level 2), cfg/log landen dort.
+    # Der Import braucht nur den Modulnamen xp; DataRefs werden erst in XPluginEnable gebunden.
+    plugin_dir = tmp_path_factory.mktemp("plugin")
+    path = plugin_dir / "main.py"
+    shutil.copy(MAIN_PY, path)
+    sys.modules.setdefault("xp", types.ModuleType("xp"))
+    spec = importlib.util.spec_from_file_location("wineuipc_main", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    module._close_log()
+
+
+def _read_block() -> bytes:
+    # ein READ über 0x0560 (8 Bytes) + Endmarke
+    return struct.pack("<IIII", 1, 0x0560, 8, 0) + bytes(8) + struct.pack("<I", 0)
+
+
+def test_non_object_json_line_keeps_connection(main):
+    assert main._DEBUG  # Default-log_level 2: recv-Debugzeile ist aktiv
+    main.mem[0x0560:0x0568] = struct.pack("<q", 123456789)
+    main._published = bytes(main.mem)  # READ wird ohne Flightloop aus dem Snapshot bedient
+
+    server = socket.create_server(("127.0.0.1", 0))
+    client = socket.create_connection(server.getsockname())
+    conn, _ = server.accept()
+    server.close()
+    errors = []
+
+    def serve():
+        try:
+            with conn:
+                main._serve_lines(conn)
+        except Exception as e:  # pragma: no cover - Fehlschlag wird unten gemeldet
+            errors.append(e)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    client.settimeout(5.0)
+    reader = client.makefile("rb")
+    try:
+        valid = json.dumps({"cmd": "ipc", "dwData": 7, "hex": _read_block().hex()}).encode() + b"\n"
+        client.sendall(valid + b"[1,2]\n" + valid)
+        replies = [json.loads(reader.readline()) for _ in range(3)]
+        assert replies[0]["ok"] and replies[2]["ok"]
+        assert replies[0] == replies[2]
+        assert replies[1]["ok"] is False
+        assert "JSON object" in replies[1]["error"]
+        reply = bytes.fromhex(replies[0]["replyHex"])
+        assert struct.unpack_from("<q", reply, 16)[0] == 123456789
+
+        # Verbindung ist noch offen
+        client.sendall(b'123\n"x"\n' + valid)
+        more = [json.loads(reader.readline()) for _ in range(3)]
+        assert [r["ok"] for r in more] == [False, False, True]
+    finally:
+        reader.close()
+        client.close()
+        thread.join(5.0)
+        main._published = None
+    assert not thread.is_alive()
+    assert errors == []
+
+
+def test_encode_position_matches_baseline_formulas(main):
+    # Referenz: die früheren encode_*-Einzelfunktionen (Lat erst /90, dann skalieren)
+    scale32 = 65536.0 * 65536.0
+
+    def signed32(deg):
+        raw = int(deg * scale32 / 360.0) & 0xFFFFFFFF
+        return raw - 0x100000000 if raw >= 0x80000000 else raw
+
+    samples = [0.0, 1e-9, 12.3456789, 47.4611111, -33.9461, 89.9999999, 90.0, -90.0, 123.0, -179.999, 180.0]
+    for i, lat in enumerate(samples):
+        lon = samples[-1 - i] * 2.0 - 1.0 if abs(samples[-1 - i]) < 90.0 else samples[-1 - i]
+        alt, pitch, roll, hdg = lat * 97.3, lat / 7.0, -lat / 3.0, lat * 4.1
+        expected = (
+            int((max(-90.0, min(90.0, lat)) / 90.0) * main.LL_SCALE),
+            int(lon * main.LON_SCALE),
+            int(alt * scale32),
+            signed32(-pitch),
+            signed32(-roll),
+            int((hdg % 360.0) * scale32 / 360.0) & 0xFFFFFFFF,
+        )
+        assert main._encode_position(lat, lon, alt, pitch, roll, hdg) == expected, lat
@@ -26,6 +26,8 @@
 #define IDC_BTN_CLOSE     1003
 #define IDC_EDIT_HOST     1004
 #define IDC_EDIT_PORT     1005
+#define XPC_FRAME_MAGIC   0x42435058u  /* "XPCB" little-endian */
+#define XPC_FRAME_STATUS_OK 0u
 
 typedef struct {
     uint32_t dwId;
@@ -40,6 +42,19 @@ typedef struct {
     uint32_t nBytes;
 } FS6IPC_WRITESTATEDATA_HDR;
 
+typedef struct {
+    uint32_t magic;
+    uint32_t dwData;
+    uint32_t cbData;
+} XPC_FRAME_REQUEST_HDR;
+
+typedef struct {
+    uint32_t magic;
+    uint32_t status;
+    uint32_t dwData;
+    uint32_t cbData;
+} XPC_FRAME_REPLY_HDR;
+
 typedef struct {
     ATOM     atom;
     HANDLE   hMap;
@@ -272,33 +287,6 @@ static size_t calc_block_len(const uint8_t* base, size_t avail){
     return 0;
 }
 
-static BOOL hex_encode(const uint8_t* data, size_t len, char** out_str, size_t* out_len){
-    size_t need = len * 2;
-    char* buf = (char*)malloc(need + 1);
-    if (!buf) return FALSE;
-    for (size_t i = 0; i < len; ++i){
-        sprintf(buf + (i * 2), "%02X", data[i]);
-    }
-    buf[need] = '\0';
-    *out_str = buf;
-    if (out_len) *out_len = need;
-    return TRUE;
-}
-
-static BOOL hex_decode(const char* hex, uint8_t* out, size_t out_cap, size_t* out_len){
-    size_t len = strlen(hex);
-    if (len % 2 != 0) return FALSE;
-    size_t bytes = len / 2;
-    if (bytes > out_cap) return FALSE;
-    for (size_t i = 0; i < bytes; ++i){
-        unsigned int val;
-        if (sscanf(hex + i * 2, "%02X", &val) != 1) return FALSE;
-        out[i] = (uint8_t)val;
-    }
-    *out_len = bytes;
-    return TRUE;
-}
-
 static void close_socket(void){
     if (g_sock != INVALID_SOCKET){
         shutdown(g_sock, SD_BOTH);
@@ -347,6 +335,11 @@ static BOOL ensure_socket(void){
         request_reconnect_timer();
         return FALSE;
     }
+    /* Request/Reply mit kleinen Frames: Nagle aus, sonst wartet jede Anfrage auf das Delayed-ACK */
+    BOOL nodelay = TRUE;
+    if (setsockopt(s, IPPROTO_TCP, TCP_NODELAY, (const char*)&nodelay, sizeof(nodelay)) == SOCKET_ERROR){
+        log_printf("setsockopt(TCP_NODELAY) failed err=%ld", WSAGetLastError());
+    }
     g_sock = s;
     stop_reconnect_timer();
     wchar_t buf[256];
@@ -356,127 +349,111 @@ static BOOL ensure_socket(void){
     return TRUE;
 }
 
-static BOOL recv_line(char** line_out){
-    char* buf = NULL;
-    size_t len = 0;
-    size_t cap = 0;
-    char chunk[1024];
-    while (1){
-        int got = recv(g_sock, chunk, sizeof(chunk), 0);
-        if (got <= 0){
-            free(buf);
-            log_printf("recv failed err=%ld", WSAGetLastError());
+static BOOL send_all(const uint8_t* data, size_t len){
+    size_t sent = 0;
+    while (sent < len){
+        int res = send(g_sock, (const char*)data + sent, (int)(len - sent), 0);
+        if (res <= 0){
+            log_printf("send failed err=%ld", WSAGetLastError());
             close_socket();
             return FALSE;
         }
-        if (len + (size_t)got + 1 > cap){
-            size_t new_cap = (len + got + 1) * 2;
-            char* tmp = (char*)realloc(buf, new_cap);
-            if (!tmp){
-                free(buf);
-                return FALSE;
-            }
-            buf = tmp;
-            cap = new_cap;
-        }
-        memcpy(buf + len, chunk, (size_t)got);
-        len += (size_t)got;
-        if (memchr(chunk, '\n', got)){
-            break;
-        }
+        sent += (size_t)res;
     }
-    buf[len] = '\0';
-    char* nl = strchr(buf, '\n');
-    if (nl) *nl = '\0';
-    *line_out = buf;
     return TRUE;
 }
 
-static BOOL send_json_request(const uint8_t* data, size_t len, DWORD dwData, DWORD cbData, uint8_t* outBuf, size_t outCap, size_t* outLen){
-    if (!ensure_socket()) return FALSE;
-
-    char* hex = NULL;
-    size_t hex_len = 0;
-    if (!hex_encode(data, len, &hex, &hex_len)){
-        return FALSE;
-    }
-
-    size_t json_cap = hex_len + 128;
-    char* json = (char*)malloc(json_cap);
-    if (!json){
-        free(hex);
+static BOOL send_header_and_block(const void* hdr, size_t hdr_len, const uint8_t* data, size_t len){
+    WSABUF bufs[2];
+    bufs[0].buf = (char*)hdr;
+    bufs[0].len = (ULONG)hdr_len;
+    bufs[1].buf = (char*)data;
+    bufs[1].len = (ULONG)len;
+    DWORD sent = 0;
+    if (WSASend(g_sock, bufs, 2, &sent, 0, NULL, NULL) == SOCKET_ERROR){
+        log_printf("WSASend failed err=%ld", WSAGetLastError());
+        close_socket();
         return FALSE;
     }
-
-    int written = _snprintf(json, json_cap, "{\"cmd\":\"ipc\",\"dwData\":%lu,\"cbData\":%lu,\"hex\":\"%s\"}\n",
-                            (unsigned long)dwData, (unsigned long)cbData, hex);
-    free(hex);
-    if (written < 0 || (size_t)written >= json_cap){
-        free(json);
-        return FALSE;
+    /* blockierende Sockets senden normalerweise alles; einen Rest per send_all nachschieben */
+    size_t done = (size_t)sent;
+    if (done < hdr_len){
+        if (!send_all((const uint8_t*)hdr + done, hdr_len - done)) return FALSE;
+        done = hdr_len;
     }
+    return send_all(data + (done - hdr_len), len - (done - hdr_len));
+}
 
-    size_t to_send = (size_t)written;
-    size_t sent = 0;
-    while (sent < to_send){
-        int res = send(g_sock, json + sent, (int)(to_send - sent), 0);
-        if (res <= 0){
-            free(json);
-            log_printf("send failed err=%ld", WSAGetLastError());
+static BOOL recv_all(uint8_t* out, size_t len){
+    size_t got_total = 0;
+    while (got_total < len){
+        int got = recv(g_sock, (char*)out + got_total, (int)(len - got_total), 0);
+        if (got <= 0){
+            log_printf("recv failed err=%ld", WSAGetLastError());
             close_socket();
             return FALSE;
         }
-        sent += (size_t)res;
+        got_total += (size_t)got;
     }
-    free(json);
+    return TRUE;
+}
+
+static BOOL send_frame_request(const uint8_t* data, size_t len, DWORD dwData, uint8_t* outBuf, size_t outCap, size_t* outLen){
+    if (!ensure_socket()) return FALSE;
 
-    char* line = NULL;
-    if (!recv_line(&line)){
-        log_printf("recv_line timeout dwData=%lu cbData=%lu len=%zu", (unsigned long)dwData, (unsigned long)cbData, len);
+    /* Header und Block gehen per Scatter/Gather in einem WSASend raus: kein malloc/memcpy pro Request. */
+    XPC_FRAME_REQUEST_HDR hdr;
+    hdr.magic = XPC_FRAME_MAGIC;
+    hdr.dwData = (uint32_t)dwData;
+    hdr.cbData = (uint32_t)len;
+    if (!send_header_and_block(&hdr, sizeof(hdr), data, len)){
         return FALSE;
     }
 
-    BOOL ok = strstr(line, "\"ok\":true") != NULL;
-    if (!ok){
-        log_printf("bridge reply error: %s", line);
-        free(line);
+    XPC_FRAME_REPLY_HDR reply;
+    if (!recv_all((uint8_t*)&reply, sizeof(reply))){
+        log_printf("recv reply header failed dwData=%lu len=%zu", (unsigned long)dwData, len);
         return FALSE;
     }
-
-    char* hex_field = strstr(line, "\"replyHex\":\"");
-    if (!hex_field){
-        free(line);
+    if (reply.magic != XPC_FRAME_MAGIC){
+        log_printf("bad reply magic 0x%08lX", (unsigned long)reply.magic);
+        close_socket();
         return FALSE;
     }
-    hex_field += strlen("\"replyHex\":\"");
-    char* end = strchr(hex_field, '"');
-    if (!end){
-        free(line);
+    if (reply.status != XPC_FRAME_STATUS_OK){
+        char msg[256];
+        size_t keep = reply.cbData < sizeof(msg) - 1 ? reply.cbData : sizeof(msg) - 1;
+        if (!recv_all((uint8_t*)msg, keep)){
+            return FALSE;
+        }
+        msg[keep] = '\0';
+        size_t skip = reply.cbData - keep;
+        while (skip > 0){
+            char sink[256];
+            size_t chunk = skip < sizeof(sink) ? skip : sizeof(sink);
+            if (!recv_all((uint8_t*)sink, chunk)){
+                return FALSE;
+            }
+            skip -= chunk;
+        }
+        log_printf("bridge reply error: %s", msg);
         return FALSE;
     }
-    size_t hex_field_len = (size_t)(end - hex_field);
-    char* hex_reply = (char*)malloc(hex_field_len + 1);
-    if (!hex_reply){
-        free(line);
+    if (reply.cbData > outCap){
+        log_printf("reply too large cap=%zu reply=%lu", outCap, (unsigned long)reply.cbData);
+        close_socket();
         return FALSE;
     }
-    memcpy(hex_reply, hex_field, hex_field_len);
-    hex_reply[hex_field_len] = '\0';
-
-    size_t reply_bytes = 0;
-    BOOL decode_ok = hex_decode(hex_reply, outBuf, outCap, &reply_bytes);
-    free(hex_reply);
-    free(line);
-    if (!decode_ok){
+    if (!recv_all(outBuf, reply.cbData)){
         return FALSE;
     }
-    *outLen = reply_bytes;
+    *outLen = reply.cbData;
     return TRUE;
 }
 
 static BOOL forward_block(uint32_t dwData, uint8_t* block, size_t len){
     size_t reply_len = 0;
-    if (!send_json_request(block, len, dwData, (DWORD)len, block, len, &reply_len)){
+    if (!send_frame_request(block, len, dwData, block, len, &reply_len)){
         return FALSE;
     }
     if (reply_len != len){
@@ -8,24 +8,42 @@
 #   Request  → {"cmd":"ipc","dwData":<uint32>,"cbData":<int>,"hex":"AABB..."}
 #   Response ← {"ok":true,"replyHex":"...","replyDwData":<uint32 optional>}
 #               oder {"ok":false,"error":"..."}
+#   Statt "hex" geht auch "b64":"<base64>" – die Antwort kommt dann als "replyB64"
+#
+# Binär-Framing (Standard für uipc_bridge.exe, erkannt am ersten Byte):
+#   Request  → "XPCB" <dwData u32> <cbData u32> <Block[cbData]>
+#   Response ← "XPCB" <status u32> <dwData u32> <cbData u32> <Block[cbData]>
+#               status 0 = ok, sonst enthält der Block den Fehlertext (UTF-8)
 #
 # Später kann handle_ipc() auf echte FSUIPC-Offsets/Logik gemappt werden
 # und X‑Plane DataRefs/Commands im Mainthread bedienen.
 
 import os
+import sys
 import json
 import socket
 import threading
 import struct
 import errno
+import binascii
+import math
+import re
 import time
 import traceback
-from queue import Queue, Empty
+import types
+from functools import partial
+from collections import deque
+from queue import SimpleQueue, Empty
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, Callable, List
+from typing import Any, Dict, Optional, Tuple, Callable, List, Union
 
 import xp  # bereitgestellt durch XPPython3
 
+try:
+    import orjson  # optional: schneller JSON-Codec, falls in XPPython3 installiert
+except ImportError:
+    orjson = None
+
 PLUGIN_DIR = os.path.dirname(__file__)
 CFG_PATH = os.path.join(PLUGIN_DIR, "wineUIPC.cfg")
 LOG_PATH = os.path.join(PLUGIN_DIR, "wineUIPC.log")
@@ -48,6 +66,13 @@ def _write_cfg(cfg: Dict[str, str]) -> None:
         f.writelines(lines)
 
 
+def _write_cfg_quietly(cfg: Dict[str, str]) -> None:
+    try:
+        _write_cfg(cfg)
+    except Exception:
+        pass
+
+
 def _load_cfg() -> Dict[str, str]:
     cfg = dict(CFG_DEFAULTS)
     try:
@@ -61,8 +86,6 @@ def _load_cfg() -> Dict[str, str]:
                 value = value.strip()
                 if key:
                     cfg[key] = value
-    except FileNotFoundError:
-        _write_cfg(cfg)
     except Exception:
         pass
     return cfg
@@ -74,27 +97,24 @@ _CFG_HOST = _CFG.get("host", CFG_DEFAULTS["host"])
 _CFG_PORT = _CFG.get("port", CFG_DEFAULTS["port"])
 
 
+_VERSION_HEX_RE = re.compile(r"0[xX][0-9a-fA-F]+")
+_DIGIT_RE = re.compile(r"\d")
+_BUILD_LETTER_RE = re.compile(r"[a-zA-Z]|[+-]?\d+")
+
+
 def _parse_fsuipc_version_x1000(value: str, default_hex: int) -> int:
     """
     Convert version string (e.g. "7.505" or "0x7505") to the BCD int used in 0x3304 HIWORD.
     """
-    if not value:
-        return default_hex
-    s = value.strip()
-    if not s:
-        return default_hex
-    try:
-        if s.lower().startswith("0x"):
-            return int(s, 16)
-    except Exception:
-        pass
-    digits = "".join(ch for ch in s if ch.isdigit())
+    s = (value or "").strip()
+    if _VERSION_HEX_RE.fullmatch(s):
+        return int(s, 16)
+    digits = "".join(_DIGIT_RE.findall(s))[:4]
     if not digits:
         return default_hex
-    digits = digits[:4]
     try:
         return int(digits, 16)
-    except Exception:
+    except ValueError:
         return default_hex
 
 
@@ -103,20 +123,12 @@ def _parse_build_letter(value: str, default_val: int) -> int:
     Convert build letter (a-z) or integer to the numeric code expected by offset 0x3304 LOWORD.
     a=1, b=2, ..., z=26; 0 means none.
     """
-    if not value:
-        return default_val
-    s = value.strip()
-    if not s:
-        return default_val
-    if len(s) == 1 and s.isalpha():
-        n = ord(s.lower()) - 96
-        if 0 <= n <= 26:
-            return n
-    try:
-        n_int = int(s)
-        return max(0, min(26, n_int))
-    except Exception:
+    s = (value or "").strip()
+    if not _BUILD_LETTER_RE.fullmatch(s):
         return default_val
+    if s.isalpha():
+        return ord(s.lower()) - 96
+    return max(0, min(26, int(s)))
 
 
 def _parse_bool(value: str, default_val: bool = False) -> bool:
@@ -136,19 +148,59 @@ _DEFAULT_FS_VERSION = int(CFG_DEFAULTS["fs_version"])
 _DEFAULT_FSUIPC_X1000 = _parse_fsuipc_version_x1000(CFG_DEFAULTS["fsuipc_version"], 0x7505)
 _DEFAULT_BUILD_LETTER = _parse_build_letter(CFG_DEFAULTS["fsuipc_build_letter"], 0)
 
+# Pro-Tick-Logging vorher gegen diese Flags prüfen, damit die f-Strings gar nicht erst gebaut werden
+_DEBUG = LOG_LEVEL >= 2
+_VERBOSE = LOG_LEVEL >= 1
+
+# Log-Zeilen gehen über eine Queue an einen Writer-Thread: kein Datei-I/O und kein strftime im Flightloop
+_LOG_Q: "SimpleQueue[Optional[Tuple[float, str, str]]]" = SimpleQueue()
+_log_thread: Optional[threading.Thread] = None
+
+def _log_writer() -> None:
+    try:
+        fh = open(LOG_PATH, "a", buffering=1 << 16)
+    except OSError:
+        fh = None  # Log nicht beschreibbar: Einträge nur noch verwerfen
+    try:
+        while True:
+            record = _LOG_Q.get()
+            if record is None:
+                break
+            if fh is None:
+                continue
+            stamp, level, message = record
+            fh.write(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stamp))} [{level}] {message}\n")
+            if _LOG_Q.empty():
+                fh.flush()
+    finally:
+        if fh is not None:
+            fh.close()
+
 def _write_log(level: str, message: str) -> None:
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    line = f"{timestamp} [{level}] {message}\n"
+    global _log_thread
+    if _log_thread is None:
+        with _LOG_LOCK:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_writer, name="wineUIPC-log", daemon=True)
+                _log_thread.start()
+    _LOG_Q.put((time.time(), level, message))
+
+def _close_log() -> None:
+    # Queue abarbeiten lassen und Datei schließen (XPluginStop); spätere Logs starten den Writer neu
+    global _log_thread
     with _LOG_LOCK:
-        with open(LOG_PATH, "a") as log_file:
-            log_file.write(line)
+        writer = _log_thread
+        _log_thread = None
+    if writer is not None:
+        _LOG_Q.put(None)
+        writer.join(timeout=2.0)
 
 def log_debug(message: str) -> None:
-    if LOG_LEVEL >= 2:
+    if _DEBUG:
         _write_log("DEBUG", message)
 
 def log_verbose(message: str) -> None:
-    if LOG_LEVEL >= 1:
+    if _VERBOSE:
         _write_log("VERBOSE", message)
 
 # ---------- Plugin Meta ----------
@@ -201,13 +253,17 @@ _CFG.update({
     "fsuipc_build_letter": str(_HANDSHAKE_BUILD_LETTER_STR or CFG_DEFAULTS["fsuipc_build_letter"]),
     "fsairlines_compat": "1" if FSAIRLINES_COMPAT else "0",
 })
-try:
-    _write_cfg(_CFG)
-except Exception:
-    pass
+# einmal mit den endgültigen Werten zurückschreiben, im Hintergrund: der Plugin-Start wartet nicht
+# auf die Platte. Kein Daemon-Thread, damit die Datei auch bei sofortigem Beenden noch geschrieben wird
+threading.Thread(target=_write_cfg_quietly, args=(dict(_CFG),), name="wineUIPC-cfg").start()
 FLIGHTLOOP_INTERVAL = 0.01  # 10 ms – genug für zügige Antworten
 MAX_PER_TICK = 100          # Sicherheitslimit
+SLOW_FIELDS_EVERY = 25      # langsame Snapshot-Felder nur jeden n-ten Tick (~250 ms)
 REPLY_TIMEOUT = 10.0        # Sekunden; Netz-Handler wartet so lange auf das Ergebnis
+FRAME_MAGIC = b"XPCB"       # Binär-Framing der uipc_bridge.exe
+MAX_FRAME_BYTES = 1 << 20   # Obergrenze für einen IPC-Block
+RECV_BUFFER_BYTES = 0x10000 # Startgröße des Empfangspuffers pro Verbindung
+SEND_BUFFER_BYTES = 0x10000 # SO_SNDBUF der Client-Sockets
 MAX_SPOILER_DEFLECTION_DEG = 60.0  # reasonable default for scaling
 FUEL_LBS_PER_GAL = 6.7
 KG_TO_LBS = 2.20462262185
@@ -248,16 +304,15 @@ RADIO_SOURCES = {
 # ---------- Logging ----------
 
 def log(msg: str) -> None:
-    if LOG_LEVEL >= 1:
+    if _VERBOSE:
         _write_log("INFO", msg)
 
 # ---------- Utils ----------
 
-def hex_to_bytes(h: str) -> bytes:
-    h = h.strip()
-    if len(h) % 2 != 0:
-        raise ValueError("hex length must be even")
-    return bytes.fromhex(h)
+def hex_to_bytes(h: str) -> bytearray:
+    # direkt als bytearray: handle_ipc kann den Block ohne weitere Kopie in-place bearbeiten.
+    # fromhex überspringt Whitespace selbst und wirft bei ungerader Länge – kein strip() nötig
+    return bytearray.fromhex(h)
 
 def bytes_to_hex(b: bytes) -> str:
     return b.hex().upper()
@@ -265,50 +320,70 @@ def bytes_to_hex(b: bytes) -> str:
 def clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
-def first(seq: List[float], default: float = 0.0) -> float:
-    return seq[0] if seq else default
-
 def _spoiler_deg_to_units(deg: float) -> int:
-    ratio = clamp(deg / MAX_SPOILER_DEFLECTION_DEG, 0.0, 1.0)
-    return int(ratio * 16383.0)
-
-def _avg_spoiler_deflection(values: List[float], start: int, count: int) -> float:
-    acc: List[float] = []
-    end = min(start + count, len(values))
-    for idx in range(start, end):
-        acc.append(max(0.0, values[idx]))
-    if not acc:
-        return 0.0
-    return sum(acc) / len(acc)
+    # wie clamp(…, 0, 1) ohne Aufrufe; NaN landet wie dort bei 1.0
+    ratio = deg / MAX_SPOILER_DEFLECTION_DEG
+    ratio = ratio if ratio < 1.0 else 1.0
+    return int((ratio if ratio > 0.0 else 0.0) * 16383.0)
+
+def _fuel_tank_units(mass_kg: float, cap_kg: float, total_cap_kg: float) -> int:
+    if cap_kg > 0.0:
+        pct = mass_kg / cap_kg
+    elif total_cap_kg > 0.0:
+        pct = mass_kg / total_cap_kg
+    else:
+        pct = 0.0
+    return int(clamp(pct, 0.0, 1.0) * 128.0 * 65536.0)
+
+def _fuel_cap_to_gal(cap_kg: float) -> int:
+    if cap_kg <= 0.0:
+        return 0
+    cap_lbs = cap_kg * KG_TO_LBS
+    cap_gal = cap_lbs / FUEL_LBS_PER_GAL
+    return int(max(0.0, min(cap_gal, (2**32 - 1))) + 0.5)
 
 def _resolve_cabin_sign(sign: str) -> int:
-    sources = CABIN_SIGN_SOURCES.get(sign, ())
-    for dataref, mode in sources:
+    # nur vorhandene Quellen (aufgelöst in _bind_fallback_datarefs); die erste gewinnt
+    for handle, mode in _CABIN_SIGN_HANDLES.get(sign, ()):
         if mode == "bool":
-            val = read_int_optional(dataref)
-            if val is None:
-                float_val = read_float_optional(dataref)
-                if float_val is None:
-                    continue
-                val = 1 if float_val >= 0.5 else 0
-            val = 1 if val else 0
-            return 2 if val else 0
-        if mode == "mode":
-            raw = read_int_optional(dataref)
-            if raw is None:
-                continue
-            return int(clamp(raw, 0, 2))
+            return 2 if xp.getDatai(handle) else 0
+        return int(clamp(xp.getDatai(handle), 0, 2))
     return 0
 
 # ---------- Request Pipeline (Mainthread Executor) ----------
 
+# nur IPC-Blöcke gehen an den Mainthread; dwData/Block sind im Netzwerk-Thread schon geprüft und dekodiert
 @dataclass
 class Request:
-    payload: Dict[str, Any]
+    dwData: int
+    data: Union[bytearray, memoryview]
     event: threading.Event
     result: Optional[Dict[str, Any]] = None
 
-REQ_QUEUE: "Queue[Request]" = Queue()
+# deque.append/popleft sind unter dem GIL atomar – kein Queue-Lock pro Request
+REQ_QUEUE: "deque[Request]" = deque()
+
+# unveränderliche Kopie von mem aus dem letzten Tick (nur solange Clients verbunden sind)
+_published: Optional[bytes] = None
+_client_count = 0
+_CLIENT_LOCK = threading.Lock()
+_snapshot_tick = 0
+_requests_applied = False  # im letzten Tick Requests im Mainthread bearbeitet (WRITEs möglich)
+_EVENT_POOL: "SimpleQueue[threading.Event]" = SimpleQueue()
+
+
+def _acquire_event() -> threading.Event:
+    try:
+        ev = _EVENT_POOL.get_nowait()
+    except Empty:
+        return threading.Event()
+    ev.clear()
+    return ev
+
+
+def _release_event(ev: threading.Event) -> None:
+    _EVENT_POOL.put(ev)
+
 _toast_text: Optional[str] = None
 _toast_expires: float = 0.0
 _toast_window: Optional[int] = None
@@ -345,6 +420,7 @@ def _toast_draw(phase: int, is_before: int, refcon: Any) -> int:
 
 MEM_SIZE = 0x8000
 mem = bytearray(MEM_SIZE)
+_MEM_VIEW = memoryview(mem)  # READs kopieren aus diesem View, ohne Zwischen-bytes; mem wird nie vergrößert
 
 # helper to write into mem with bounds checking
 def _write(offset: int, data: bytes) -> None:
@@ -353,164 +429,447 @@ def _write(offset: int, data: bytes) -> None:
         raise ValueError(f"mem write out of range: 0x{offset:04X}")
     mem[offset:end] = data
 
-def _write_int(offset: int, value: int, size: int, signed: bool = False) -> None:
+# vorkompilierte Layouts – pack_into schreibt direkt in mem, ohne Zwischen-bytes
+_S_U8 = struct.Struct("<B")
+_S_U16 = struct.Struct("<H")
+_S_S16 = struct.Struct("<h")
+_S_U32 = struct.Struct("<I")
+_S_S32 = struct.Struct("<i")
+_S_S64 = struct.Struct("<q")
+_S_F64 = struct.Struct("<d")
+_S_HANDSHAKE = struct.Struct("<IHH")      # 0x3304 Version/Build, 0x3308 FS-Version, 0x330A 0xFADE
+_S_LOCAL_TIME = struct.Struct("<BBBBB")   # 0x0238 Std/Min/Sek lokal, 0x023B Std/Min Zulu
+_S_DATE = struct.Struct("<HH")            # 0x023E Tag im Jahr, 0x0240 Jahr
+_S_POSITION = struct.Struct("<qqqiiI")    # 0x0560 Lat, Lon, Alt, Pitch, Bank, Heading
+_S_SPEEDS = struct.Struct("<III")         # 0x02B4 GS, TAS, IAS
+_S_BARBER_VS = struct.Struct("<II")       # 0x02C4 Barber Pole, VS
+_S_GFORCE = struct.Struct("<hh")          # 0x11B8 G-Kraft, 0x11BA G-Kraft (Kopie)
+_S_LIGHTS = struct.Struct("<BB")          # 0x0280 Nav, 0x0281 Beacon/Strobe
+_S_GEAR_TYPE = struct.Struct("<HH")       # 0x060C Einziehbar, 0x060E Fahrwerkstyp
+_S_FLAPS_SPOILERS = struct.Struct("<7I")  # 0x0BCC Spoiler Arm, Spoiler, L/R Spoiler, Flaps Cmd/L/R
+_S_FUEL_TANKS = struct.Struct("<14I")     # 0x0B74 je Tank Level + Kapazität: C, LM, LA, LT, RM, RA, RT
+_S_FUEL_LEFT = struct.Struct("<4I")       # 0x0B74 Center Level/Kapazität, Left Main Level/Kapazität
+_S_FUEL_RIGHT = struct.Struct("<II")      # 0x0B94 Right Main Level/Kapazität
+_S_ENGINE_GAUGES = struct.Struct("<HHH")  # Combustion, N2, N1 (Slot-Basis)
+_S_ENGINE_OIL = struct.Struct("<HH")      # Öltemperatur, Öldruck
+_S_BARO = struct.Struct("<HH")            # 0x0330 Kollsman hPa*16, 0x0332 inHg*16
+_S_WEIGHTS = struct.Struct("<dd")         # 0x30C0 Gewicht lbs, 0x30C8 Masse slugs
+_S_CABIN_SIGNS = struct.Struct("<BB")     # 0x3414 Seatbelt, 0x3415 No Smoking
+_S_COM_STBY = struct.Struct("<HHH")       # 0x3118 COM2 aktiv, 0x311A COM1 Standby, 0x311C COM2 Standby
+_S_WIND = struct.Struct("<HH")            # Speed kt, Richtung (0x0E90 Umgebung, 0x04D8 Bodenschicht)
+_S_SURFACE_WIND = struct.Struct("<HHH")   # 0x0EEE Obergrenze ft AGL, Speed kt, Richtung
+
+# je Triebwerk: Combustion (N2/N1 folgen direkt), Fuel Flow, Öltemperatur (Öldruck folgt direkt)
+_ENGINE_SLOTS = (
+    (0x0894, 0x090A, 0x08B8),
+    (0x092C, 0x0942, 0x0950),
+    (0x09C4, 0x09DA, 0x09E8),
+    (0x0A5C, 0x0A72, 0x0A80),
+)
+
+_INT_LIMITS = {
+    "B": (0, 0xFF),
+    "H": (0, 0xFFFF),
+    "h": (-0x8000, 0x7FFF),
+    "I": (0, 0xFFFFFFFF),
+    "i": (-0x80000000, 0x7FFFFFFF),
+    "q": (-(1 << 63), (1 << 63) - 1),
+}
+
+def _saturate(code: str, value: Any) -> Any:
+    limits = _INT_LIMITS.get(code)
+    if limits is None:
+        return float(value)
+    lo, hi = limits
+    value = int(value)
+    return lo if value < lo else hi if value > hi else value
+
+def _write_block(st: struct.Struct, offset: int, *values: Any) -> None:
+    # benachbarte Felder in einem pack_into; nur bei Überlauf feldweise sättigen
     try:
-        b = int(value).to_bytes(size, "little", signed=signed)
-    except OverflowError:
-        max_val = (2 ** (size * 8 - 1) - 1) if signed else (2 ** (size * 8) - 1)
-        min_val = -(2 ** (size * 8 - 1)) if signed else 0
-        clamped = max(min(int(value), max_val), min_val)
-        b = clamped.to_bytes(size, "little", signed=signed)
-    _write(offset, b)
+        st.pack_into(mem, offset, *values)
+    except struct.error:
+        st.pack_into(mem, offset, *map(_saturate, _field_codes(st), values))
+
+_FIELD_CODES: Dict[str, List[str]] = {}
+
+def _field_codes(st: struct.Struct) -> List[str]:
+    # ein Formatzeichen pro Feld, Wiederholungen ausgeschrieben ("<7I" → 7× "I")
+    codes = _FIELD_CODES.get(st.format)
+    if codes is None:
+        codes = [code for count, code in re.findall(r"(\d*)(\D)", st.format.lstrip("<")) for _ in range(int(count or 1))]
+        _FIELD_CODES[st.format] = codes
+    return codes
 
+# Einzelfelder ohne den *values-Umweg über _write_block (kostet sonst ein Vielfaches des pack_into)
 def _write_u8(offset: int, value: int) -> None:
-    _write_int(offset, value, 1, signed=False)
+    try:
+        _S_U8.pack_into(mem, offset, value)
+    except struct.error:
+        _S_U8.pack_into(mem, offset, _saturate("B", value))
 
-def _write_s32(offset: int, value: int) -> None:
-    _write_int(offset, value, 4, signed=True)
+def _pack_saturated(st: struct.Struct, code: str, offset: int, value: Any) -> None:
+    try:
+        st.pack_into(mem, offset, value)
+    except struct.error:
+        st.pack_into(mem, offset, _saturate(code, value))
+
+if sys.byteorder == "little":
+    # typisierte Views auf mem: eine ausgerichtete Zuweisung ist billiger als pack_into; unausgerichtete
+    # Offsets, floats und Überläufe (ValueError/TypeError) gehen den sättigenden pack_into-Weg
+    _MEM_U16 = _MEM_VIEW.cast("H")
+    _MEM_S16 = _MEM_VIEW.cast("h")
+    _MEM_U32 = _MEM_VIEW.cast("I")
+    _MEM_S32 = _MEM_VIEW.cast("i")
+
+    def _write_s32(offset: int, value: int) -> None:
+        if not offset & 3:
+            try:
+                _MEM_S32[offset >> 2] = value
+                return
+            except (ValueError, TypeError):
+                pass
+        _pack_saturated(_S_S32, "i", offset, value)
 
-def _write_u16(offset: int, value: int) -> None:
-    _write_int(offset, value, 2, signed=False)
+    def _write_u16(offset: int, value: int) -> None:
+        if not offset & 1:
+            try:
+                _MEM_U16[offset >> 1] = value
+                return
+            except (ValueError, TypeError):
+                pass
+        _pack_saturated(_S_U16, "H", offset, value)
 
-def _write_s16(offset: int, value: int) -> None:
-    _write_int(offset, value, 2, signed=True)
+    def _write_s16(offset: int, value: int) -> None:
+        if not offset & 1:
+            try:
+                _MEM_S16[offset >> 1] = value
+                return
+            except (ValueError, TypeError):
+                pass
+        _pack_saturated(_S_S16, "h", offset, value)
 
-def _write_u32(offset: int, value: int) -> None:
-    _write_int(offset, value, 4, signed=False)
+    def _write_u32(offset: int, value: int) -> None:
+        if not offset & 3:
+            try:
+                _MEM_U32[offset >> 2] = value
+                return
+            except (ValueError, TypeError):
+                pass
+        _pack_saturated(_S_U32, "I", offset, value)
+else:
+    def _write_s32(offset: int, value: int) -> None:
+        _pack_saturated(_S_S32, "i", offset, value)
 
-def _write_s64(offset: int, value: int) -> None:
-    _write_int(offset, value, 8, signed=True)
+    def _write_u16(offset: int, value: int) -> None:
+        _pack_saturated(_S_U16, "H", offset, value)
 
-def _write_f64(offset: int, value: float) -> None:
-    _write(offset, struct.pack("<d", float(value)))
+    def _write_s16(offset: int, value: int) -> None:
+        _pack_saturated(_S_S16, "h", offset, value)
 
-# --- DataRef bindings (lazy) ---
+    def _write_u32(offset: int, value: int) -> None:
+        _pack_saturated(_S_U32, "I", offset, value)
 
-DATAREFS = {}
+def _write_s64(offset: int, value: int) -> None:
+    _pack_saturated(_S_S64, "q", offset, value)
 
-def dr(name: str) -> int:
-    if name not in DATAREFS:
-        DATAREFS[name] = xp.findDataRef(name)
-    return DATAREFS[name]
+def _write_f64(offset: int, value: float) -> None:
+    _S_F64.pack_into(mem, offset, float(value))
+
+# --- DataRef-Handles für update_snapshot (einmalig in XPluginEnable gebunden) ---
+
+# key -> (DataRef, Typ: f/d/i = Skalar, vf/vi = Array in den Puffer unten, f?/i?/n? = optional)
+_SNAPSHOT_DATAREFS = {
+    "lat": ("sim/flightmodel/position/latitude", "d"),
+    "lon": ("sim/flightmodel/position/longitude", "d"),
+    "elevation": ("sim/flightmodel/position/elevation", "d"),
+    "pitch": ("sim/flightmodel/position/theta", "f"),
+    "roll": ("sim/flightmodel/position/phi", "f"),
+    "heading_mag": ("sim/cockpit/autopilot/heading_mag", "f"),
+    "psi": ("sim/flightmodel/position/psi", "f"),
+    "groundspeed": ("sim/flightmodel/position/groundspeed", "f"),
+    "true_airspeed": ("sim/flightmodel/position/true_airspeed", "f"),
+    "ias_kts": ("sim/cockpit2/gauges/indicators/airspeed_kts_pilot", "f"),
+    "ias_mps": ("sim/flightmodel/position/indicated_airspeed", "f"),
+    "vs_fpm": ("sim/flightmodel/position/vh_ind_fpm", "f"),
+    "onground_any": ("sim/flightmodel/failures/onground_any", "i"),
+    "y_agl": ("sim/flightmodel/position/y_agl", "f"),
+    "mag_var": ("sim/flightmodel/position/magnetic_variation", "f"),
+    "over_g": ("sim/flightmodel/failures/over_g", "i"),
+    "paused": ("sim/time/paused", "i"),
+    "nav_lights": ("sim/cockpit2/switches/navigation_lights_on", "i"),
+    "beacon": ("sim/cockpit2/switches/beacon_on", "i"),
+    "strobe": ("sim/cockpit2/switches/strobe_lights_on", "i"),
+    "landing_lights": ("sim/cockpit2/switches/landing_lights_on", "i"),
+    "taxi_light": ("sim/cockpit2/switches/taxi_light_on", "i"),
+    "parkbrake": ("sim/flightmodel/controls/parkbrake", "f"),
+    "flap_ratio": ("sim/flightmodel/controls/flaprat", "f"),
+    "spoiler_ratio": ("sim/flightmodel/controls/sbrkrat", "f"),
+    "spoiler_left_deg": ("sim/flightmodel/controls/lsplrdef", "f"),
+    "spoiler_right_deg": ("sim/flightmodel/controls/rsplrdef", "f"),
+    "speedbrake_ratio": ("sim/cockpit2/controls/speedbrake_ratio", "f"),
+    "gear_handle_down": ("sim/cockpit2/controls/gear_handle_down", "i"),
+    "gear_retract": ("sim/aircraft/gear/acf_gear_retract", "f"),
+    "gear_on_ground": ("sim/flightmodel2/gear/on_ground", "vi"),
+    "gear_deploy": ("sim/flightmodel2/gear/deploy_ratio", "vf"),
+    "panel_brightness": ("sim/cockpit2/switches/panel_brightness_ratio", "vf"),
+    "fuel_tanks": ("sim/flightmodel/weight/m_fuel", "vf"),
+    "avionics_sources": ("sim/cockpit2/switches/avionics_power_on", "vi"),
+    "battery_sources": ("sim/cockpit2/electrical/battery_on", "vi"),
+    "eng_n1": ("sim/flightmodel/engine/ENGN_N1_", "vf"),
+    "eng_n2": ("sim/flightmodel/engine/ENGN_N2_", "vf"),
+    "eng_running": ("sim/flightmodel/engine/ENGN_running", "vi"),
+    "eng_fuel_flow": ("sim/cockpit2/engine/indicators/fuel_flow_kg_sec", "vf"),
+    "eng_oil_temp": ("sim/cockpit2/engine/indicators/oil_temperature_deg_C", "vf"),
+    "eng_oil_press": ("sim/cockpit2/engine/indicators/oil_pressure_psi", "vf"),
+    "num_engines": ("sim/aircraft/engine/acf_num_engines", "i"),
+    "fuel_total": ("sim/flightmodel/weight/m_fuel_total", "f"),
+    "avionics_on": ("sim/cockpit/electrical/avionics_on", "i"),
+    "battery_on": ("sim/cockpit/electrical/battery_on", "i"),
+    "gforce": ("sim/flightmodel2/misc/gforce_normal", "f"),
+    "wind_speed": ("sim/weather/aircraft/wind_now_speed_msc", "f"),
+    "wind_dir": ("sim/weather/aircraft/wind_now_direction_degt", "f"),
+    # optional (f?/i?/n?): Getter liefert None, wenn der DataRef fehlt; n? = read_int, als float
+    "local_time": ("sim/time/local_time_sec", "f?"),
+    "zulu_time": ("sim/time/zulu_time_sec", "f?"),
+    "local_date_days": ("sim/time/local_date_days", "i?"),
+    "framerate_period": ("sim/time/framerate_period", "f?"),
+    "frame_rate_period": ("sim/operation/misc/frame_rate_period", "f?"),
+    "sim_speed_actual": ("sim/time/sim_speed_actual", "f?"),
+    "compass_heading": ("sim/cockpit2/gauges/indicators/heading_electric_deg_mag_pilot", "f?"),
+    "stall_ratio": ("sim/cockpit2/annunciators/stall_warning_ratio", "f?"),
+    "stall_annun": ("sim/cockpit2/annunciators/stall_warning", "i?"),
+    "stall_fail": ("sim/flightmodel/failures/stallwarning", "i?"),
+    "overspeed_pref": ("sim/operation/prefs/warn_overspeed", "i?"),
+    "overspeed_vne": ("sim/flightmodel/failures/over_vne", "i?"),
+    "baro_copilot": ("sim/cockpit2/gauges/actuators/barometer_setting_in_hg_copilot", "f?"),
+    "baro_stby": ("sim/cockpit2/gauges/actuators/barometer_setting_in_hg_stby", "f?"),
+    "alt_copilot": ("sim/cockpit2/gauges/indicators/altitude_ft_copilot", "f?"),
+    "total_mass": ("sim/flightmodel/weight/m_total", "f?"),
+    "nav1_hz": ("sim/cockpit/radios/nav1_freq_hz", "n?"),
+    "nav2_hz": ("sim/cockpit/radios/nav2_freq_hz", "n?"),
+    "adf1_hz": ("sim/cockpit/radios/adf1_freq_hz", "n?"),
+    "adf2_hz": ("sim/cockpit/radios/adf2_freq_hz", "n?"),
+    "adf2_dir": ("sim/cockpit/radios/adf2_dir_degt", "f?"),
+    "nav1_dme_dist": ("sim/cockpit/radios/nav1_dme_dist_m", "f?"),
+    "nav1_dme_speed": ("sim/cockpit/radios/nav1_dme_speed_kts", "f?"),
+    "nav1_dme_time": ("sim/cockpit/radios/nav1_dme_time_secs", "f?"),
+    "nav2_dme_dist": ("sim/cockpit/radios/nav2_dme_dist_m", "f?"),
+    "nav2_dme_speed": ("sim/cockpit/radios/nav2_dme_speed_kts", "f?"),
+    "nav2_dme_time": ("sim/cockpit/radios/nav2_dme_time_secs", "f?"),
+    "ap_type": ("sim/aircraft/autopilot/preconfigured_ap_type", "i?"),
+    "ap_altitude": ("sim/cockpit/autopilot/altitude", "f?"),
+    "ap_airspeed": ("sim/cockpit/autopilot/airspeed", "f?"),
+    "ap_is_mach": ("sim/cockpit/autopilot/airspeed_is_mach", "i?"),
+    "wind_region_speed": ("sim/weather/region/wind_speed_msc", "vf"),
+    "wind_region_dir": ("sim/weather/region/wind_direction_degt", "vf"),
+    "wind_region_top": ("sim/weather/region/wind_altitude_msl_m", "vf"),
+    "wind_region_dew": ("sim/weather/region/dewpoint_deg_c", "vf"),
+}
 
-def read_float(name: str) -> float:
-    handle = dr(name)
-    if handle is None:
-        return 0.0
-    return xp.getDataf(handle)
+# Fallback-Ketten: der erste vorhandene DataRef gewinnt; aufgelöst in _bind_fallback_datarefs
+# (Enable + Flugzeugwechsel), nicht pro Tick. key → (Namen, Typ, Default wenn keiner existiert)
+_FALLBACK_DATAREFS: Dict[str, Tuple[Tuple[str, ...], str, float]] = {
+    "indicated_alt_ft": ((
+        "sim/cockpit2/gauges/indicators/altitude_ft_pilot",
+        "sim/flightmodel/misc/h_ind",
+    ), "f", 0.0),
+    "sim_speed": (("sim/time/sim_speed",), "f", 1.0),
+    "baro_inhg": ((
+        "sim/cockpit2/gauges/actuators/barometer_setting_in_hg_pilot",
+        "sim/cockpit/misc/barometer_setting",
+    ), "f", 29.92),
+    "fuel_capacity_lbs": (("sim/aircraft/weight/acf_m_fuel_tot",), "f", 0.0),
+    "empty_mass_kg": ((
+        "sim/flightmodel/weight/m_fixed",
+        "sim/aircraft/weight/acf_m_empty",
+    ), "f", 0.0),
+    "max_gross_kg": ((
+        "sim/flightmodel/weight/m_max",
+        "sim/aircraft/weight/acf_m_max",
+    ), "f", 0.0),
+    "xpdr_code": ((
+        "sim/cockpit2/radios/actuators/transponder_code",
+        "sim/cockpit/radios/transponder_code",
+    ), "i", 0),
+    "xpdr_mode": ((
+        "sim/cockpit/radios/transponder_mode",
+        "sim/cockpit2/radios/actuators/transponder_mode",
+    ), "i", 0),
+}
 
-def read_double(name: str) -> float:
-    handle = dr(name)
-    if handle is None:
-        return 0.0
-    return xp.getDatad(handle)
+# vorhandene Handles aus CABIN_SIGN_SOURCES / RADIO_SOURCES, in Quell-Reihenfolge; gefüllt in _bind_fallback_datarefs
+_CABIN_SIGN_HANDLES: Dict[str, Tuple[Tuple[Any, str], ...]] = {}
+_RADIO_HANDLES: Dict[str, Tuple[Tuple[str, Any, float], ...]] = {}
+
+# Text-DataRefs der Flugzeugkennung (langsamer Teil): key → (Name, max. Länge)
+_STRING_DATAREFS: Dict[str, Tuple[str, int]] = {
+    "acf_icao": ("sim/aircraft/view/acf_ICAO", 40),
+    "acf_descrip": ("sim/aircraft/view/acf_descrip", 260),
+    "acf_tailnum": ("sim/aircraft/view/acf_tailnum", 40),
+    "acf_livery": ("sim/aircraft/view/acf_livery_path", 260),
+    "acf_path": ("sim/aircraft/view/acf_relative_path", 260),
+    "xplane_path": ("sim/system/directory_path", 256),
+}
 
-def read_int(name: str) -> int:
-    handle = dr(name)
-    if handle is None:
-        return 0
-    return xp.getDatai(handle)
+# wiederverwendete Puffer für die Array-DataRefs (keine Listen-Allokation pro Tick)
+_BUF_GEAR_ON_GROUND = [0] * 3
+_BUF_GEAR_DEPLOY = [0.0] * 3
+_BUF_PANEL_BRIGHTNESS = [0.0] * 4
+_BUF_FUEL_TANKS = [0.0] * 9
+_BUF_AVIONICS_SOURCES = [0] * 2
+_BUF_BATTERY_SOURCES = [0] * 4
+_BUF_WIND_REGION_SPEED = [0.0]  # nur Layer 0
+_BUF_WIND_REGION_DIR = [0.0]  # nur Layer 0
+_BUF_WIND_REGION_TOP = [0.0]  # nur Layer 0
+_BUF_WIND_REGION_DEW = [0.0]  # nur Layer 0
+_BUF_N1 = [0.0] * 4
+_BUF_N2 = [0.0] * 4
+_BUF_ENG_RUNNING = [0] * 4
+_BUF_FUEL_FLOW = [0.0] * 4
+_BUF_OIL_TEMP = [0.0] * 4
+_BUF_OIL_PRESS = [0.0] * 4
+
+# abgeleitete Tank-Kapazitäten (kg), pro Tick in-place neu berechnet
+_BUF_FUEL_CAPS = [0.0] * 9
+_NO_FUEL_CAPS = (0.0,) * 9
+
+_VECTOR_BUFFERS = {
+    "gear_on_ground": _BUF_GEAR_ON_GROUND,
+    "gear_deploy": _BUF_GEAR_DEPLOY,
+    "panel_brightness": _BUF_PANEL_BRIGHTNESS,
+    "fuel_tanks": _BUF_FUEL_TANKS,
+    "avionics_sources": _BUF_AVIONICS_SOURCES,
+    "battery_sources": _BUF_BATTERY_SOURCES,
+    "wind_region_speed": _BUF_WIND_REGION_SPEED,
+    "wind_region_dir": _BUF_WIND_REGION_DIR,
+    "wind_region_top": _BUF_WIND_REGION_TOP,
+    "wind_region_dew": _BUF_WIND_REGION_DEW,
+    "eng_n1": _BUF_N1,
+    "eng_n2": _BUF_N2,
+    "eng_running": _BUF_ENG_RUNNING,
+    "eng_fuel_flow": _BUF_FUEL_FLOW,
+    "eng_oil_temp": _BUF_OIL_TEMP,
+    "eng_oil_press": _BUF_OIL_PRESS,
+}
 
-def read_int_optional(name: str) -> Optional[int]:
-    handle = dr(name)
-    if handle is None:
-        return None
-    return xp.getDatai(handle)
+def _missing() -> None:
+    return None
+
+def _constant(value: Any) -> Any:
+    return value
+
+def _number_getter(handle: Any) -> Callable[[], float]:
+    # vorhandener numerischer DataRef wird als int gelesen
+    get = xp.getDatai
+    return lambda: float(get(handle))
+
+# parameterlose Getter je key, in _bind_datarefs gebaut: update_snapshot ruft R.lat() ohne None-Prüfung.
+# Fehlende DataRefs bekommen float/int als Getter (liefern 0.0 bzw. 0), optionale
+# _missing (None); die Array-Puffer bleiben dann einfach auf 0.
+_Read = types.SimpleNamespace(**{
+    key: _missing if kind.endswith("?") else float for key, (_, kind) in _SNAPSHOT_DATAREFS.items()
+}, **{
+    key: partial(_constant, default) for key, (_, _, default) in _FALLBACK_DATAREFS.items()
+}, **{
+    key: partial(_constant, "") for key in _STRING_DATAREFS
+})
 
-def read_float_optional(name: str) -> Optional[float]:
-    handle = dr(name)
-    if handle is None:
-        return None
-    return xp.getDataf(handle)
-
-def read_int_fallback(names: Tuple[str, ...], default: int = 0) -> int:
-    for name in names:
-        handle = dr(name)
-        if handle is not None:
-            return xp.getDatai(handle)
-    return default
-
-def read_float_fallback(names: Tuple[str, ...], default: float = 0.0) -> float:
-    for name in names:
-        handle = dr(name)
-        if handle is not None:
-            return xp.getDataf(handle)
-    return default
-
-def read_array(name: str, count: int) -> List[float]:
-    handle = dr(name)
-    if handle is None:
-        return [0.0] * count
-    buf = [0.0] * count
-    xp.getDatavf(handle, buf, 0, count)
-    return buf
-
-def read_int_array(name: str, count: int) -> List[int]:
-    handle = dr(name)
-    if handle is None:
-        return [0] * count
-    buf = [0] * count
-    xp.getDatavi(handle, buf, 0, count)
-    return buf
-
-def read_array_range(name: str, start: int, count: int) -> List[float]:
-    handle = dr(name)
-    if handle is None:
-        return [0.0] * count
-    buf = [0.0] * count
-    xp.getDatavf(handle, buf, start, count)
-    return buf
-
-def read_string(name: str, max_len: int = 260) -> str:
-    handle = dr(name)
-    if handle is None:
-        log_debug(f"read_string({name!r}): dataref not found")
-        return ""
+def _bind_datarefs() -> None:
+    getters = {"f": xp.getDataf, "d": xp.getDatad, "i": xp.getDatai, "f?": xp.getDataf, "i?": xp.getDatai}
+    vector_getters = {"vf": xp.getDatavf, "vi": xp.getDatavi}
+    missing = []
+    for key, (name, kind) in _SNAPSHOT_DATAREFS.items():
+        handle = xp.findDataRef(name)
+        if kind in vector_getters:
+            buf = _VECTOR_BUFFERS[key]
+            buf[:] = [type(buf[0])()] * len(buf)
+            if handle is None:
+                getter = int
+            else:
+                getter = partial(vector_getters[kind], handle, buf, 0, len(buf))
+        elif handle is None:
+            if kind.endswith("?"):
+                setattr(_Read, key, _missing)
+                continue  # optional – fehlt je nach X-Plane-Version/Flugzeug, nicht melden
+            getter = int if kind == "i" else float
+        elif kind == "n?":
+            getter = _number_getter(handle)
+        else:
+            getter = partial(getters[kind], handle)
+        setattr(_Read, key, getter)
+        if handle is None:
+            missing.append(name)
+    for key, (name, max_len) in _STRING_DATAREFS.items():
+        handle = xp.findDataRef(name)
+        if handle is None:
+            setattr(_Read, key, partial(_constant, ""))
+            missing.append(name)
+        else:
+            setattr(_Read, key, partial(_read_string_handle, name, handle, max_len))
+    if missing:
+        log(f"datarefs not found: {', '.join(missing)}")
+    _bind_fallback_datarefs()
+
+def _bind_fallback_datarefs() -> None:
+    getters = {"f": xp.getDataf, "i": xp.getDatai}
+    for key, (names, kind, default) in _FALLBACK_DATAREFS.items():
+        getter = partial(_constant, default)
+        for name in names:
+            handle = xp.findDataRef(name)
+            if handle is not None:
+                getter = partial(getters[kind], handle)
+                break
+        setattr(_Read, key, getter)
+    for sign, sources in CABIN_SIGN_SOURCES.items():
+        found = []
+        for name, mode in sources:
+            handle = xp.findDataRef(name)
+            if handle is not None:
+                found.append((handle, mode))
+        _CABIN_SIGN_HANDLES[sign] = tuple(found)
+    for key, sources in RADIO_SOURCES.items():
+        found = []
+        for name, scale in sources:
+            handle = xp.findDataRef(name)
+            if handle is not None:
+                found.append((name, handle, scale))
+        _RADIO_HANDLES[key] = tuple(found)
+
+def _read_string_handle(name: str, handle: Any, max_len: int) -> str:
     try:
         val = xp.getDatas(handle, count=max_len)
-        log_debug(f"read_string({name!r}): {val!r}")
+        if _DEBUG:
+            log_debug(f"read_string({name!r}): {val!r}")
         return val
     except Exception as e:
-        log_debug(f"read_string({name!r}): exception {e}")
+        if _DEBUG:
+            log_debug(f"read_string({name!r}): exception {e}")
         return ""
 
-def encode_angle32(deg: float) -> int:
-    return int(deg * (65536.0 * 65536.0) / 360.0) & 0xFFFFFFFF
-
-def encode_signed_angle32(deg: float) -> int:
-    raw = encode_angle32(deg)
-    if raw >= 0x80000000:
-        raw -= 0x100000000
-    return raw
-
-def encode_heading32(deg: float) -> int:
-    return encode_angle32(deg % 360.0)
+# gefaltete Konstanten: 360/2^n ist exakt darstellbar, x / _ANGLE32_STEP rundet also genau wie x * 2^n / 360
+_ANGLE32_STEP = 360.0 / (65536.0 * 65536.0)
+_DIRECTION16_STEP = 360.0 / 65536.0
+_ALT_SCALE = 65536.0 * 65536.0
 
-def encode_altitude_m(meters: float) -> int:
-    scale = 65536.0 * 65536.0
-    return int(meters * scale)
+def encode_signed_angle16(deg: float) -> int:
+    # ±180° → ±32768 (Magnetic Variation, relative Peilungen)
+    return int(deg / _DIRECTION16_STEP)
 
 def encode_speed_knots128(knots: float) -> int:
     return int(knots * 128.0) & 0xFFFFFFFF
 
-def encode_vs_mps256(mps: float) -> int:
-    return int(mps * 256.0) & 0xFFFFFFFF
-
 def encode_direction16(deg: float) -> int:
-    return int((deg % 360.0) / 360.0 * 65536.0) & 0xFFFF
-
-def _read_number_optional(name: str) -> Optional[float]:
-    val_int = read_int_optional(name)
-    if val_int is not None:
-        return float(val_int)
-    return read_float_optional(name)
+    return int((deg % 360.0) / _DIRECTION16_STEP) & 0xFFFF
 
 def encode_bcd4(value: int, *, octal: bool = False) -> int:
-    clamped = max(0, min(int(value), 9999))
-    digits = [int(x) for x in f"{clamped:04d}"]
+    # Ziffern per divmod statt über f-String und Listen
+    rest, d3 = divmod(max(0, min(int(value), 9999)), 10)
+    rest, d2 = divmod(rest, 10)
+    d0, d1 = divmod(rest, 10)
     if octal:
-        digits = [min(d, 7) for d in digits]
-    return (digits[0] << 12) | (digits[1] << 8) | (digits[2] << 4) | digits[3]
+        d0, d1, d2, d3 = min(d0, 7), min(d1, 7), min(d2, 7), min(d3, 7)
+    return (d0 << 12) | (d1 << 8) | (d2 << 4) | d3
 
 def encode_com_freq(freq_input: float) -> int:
     if freq_input <= 0.0:
@@ -552,41 +911,43 @@ def write_ascii(offset: int, text: str, size: int) -> None:
     data[:len(encoded)] = encoded
     _write(offset, bytes(data))
 
-def _read_radio_frequency(key: str) -> float:
-    for name, scale in RADIO_SOURCES.get(key, ()):
-        val = _read_number_optional(name)
-        if val is None:
-            continue
-        freq = float(val) * scale
-        if freq > 0.0:
-            return freq
-    return 0.0
-
-
 def _read_radio_frequency_debug(key: str) -> Tuple[float, str]:
-    for name, scale in RADIO_SOURCES.get(key, ()):
-        val = _read_number_optional(name)
-        if val is None:
-            continue
-        freq = float(val) * scale
+    for name, handle, scale in _RADIO_HANDLES.get(key, ()):
+        freq = float(xp.getDatai(handle)) * scale
         if freq > 0.0:
             return freq, name
     return 0.0, ""
 
 LL_SCALE = 10001750.0 * 65536.0 * 65536.0
 LON_SCALE = (65536.0 * 65536.0 * 65536.0 * 65536.0) / 360.0
-
-def encode_latitude(deg: float) -> int:
-    deg = clamp(deg, -90.0, 90.0)
-    return int((deg / 90.0) * LL_SCALE)
+_BARBER_POLE_128 = encode_speed_knots128(320.0)
+_LIGHTS_NAV_MASK = (1 << 0) | (1 << 6) | (1 << 7) | (1 << 8) | (1 << 9)  # Nav, Recognition, Wing, Logo, Cabin
 
 def encode_longitude(deg: float) -> int:
-    while deg < -180.0:
-        deg += 360.0
-    while deg > 180.0:
-        deg -= 360.0
+    if deg < -180.0 or deg > 180.0:
+        # ohne Schleife normalisieren; ±inf aus einem kaputten DataRef hätte die while-Schleifen nie verlassen
+        if not math.isfinite(deg):
+            return 0
+        deg -= 360.0 * math.floor((deg + 180.0) / 360.0)
     return int(deg * LON_SCALE)
 
+def _encode_position(lat: float, lon: float, alt_m: float, pitch: float, roll: float, heading: float) -> Tuple[int, int, int, int, int, int]:
+    # alle Felder von 0x0560 in einem Aufruf (Flightloop); bitgleich zu den früheren encode_*-Einzelfunktionen,
+    # nur Längengrade außerhalb ±180° normalisiert encode_longitude ohne Schleife (±180° selbst kann kippen)
+    step = _ANGLE32_STEP
+    pitch_raw = int(-pitch / step) & 0xFFFFFFFF
+    roll_raw = int(-roll / step) & 0xFFFFFFFF
+    return (
+        # erst /90, dann skalieren – ein gefaltetes LL_SCALE/90 rundet im letzten Bit anders
+        int((max(-90.0, min(90.0, lat)) / 90.0) * LL_SCALE),
+        # Normalfall ohne Funktionsaufruf; nur ungültige/außerhalb liegende Werte über encode_longitude
+        int(lon * LON_SCALE) if -180.0 <= lon <= 180.0 else encode_longitude(lon),
+        int(alt_m * _ALT_SCALE),
+        pitch_raw - 0x100000000 if pitch_raw >= 0x80000000 else pitch_raw,
+        roll_raw - 0x100000000 if roll_raw >= 0x80000000 else roll_raw,
+        int((heading % 360.0) / step) & 0xFFFFFFFF,
+    )
+
 def metres_to_fs_ground_alt(metres: float) -> Tuple[int, int]:
     coarse = int(metres * 256.0)
     fine = int(round(metres))
@@ -595,44 +956,50 @@ def metres_to_fs_ground_alt(metres: float) -> Tuple[int, int]:
     return coarse, fine
 
 
-def update_snapshot() -> None:
-    global _prev_xpdr_code, _prev_xpdr_mode, _last_on_ground, _landing_rate_raw, _landing_rate_frozen, _handshake_logged
+def update_snapshot(full: bool = True) -> bool:
+    # full=False: nur die schnell veränderlichen Felder (Position, Lage, Speeds, Boden, Triebwerke,
+    # Höhenmesser); Licht, Klappen, Fahrwerk, Fuel, Funk, Wind usw. schreibt _update_slow_fields.
+    # False = pausiert übersprungen, mem ist unverändert
+    global _last_on_ground, _landing_rate_raw, _landing_rate_frozen, _handshake_logged, _paused_snapshot_done
+    R = _Read
+    # pausiert ändert sich am schnellen Teil nichts: nach einem Schreibdurchgang nur noch die vollen
+    # Ticks rechnen (Funk/AP/Licht bleiben so auch in der Pause aktuell)
+    if _paused_snapshot_done and not full:
+        if R.paused():
+            return False
+        _paused_snapshot_done = False
+    debug = _DEBUG
+    verbose = _VERBOSE
     # Handshake Offsets
     # HIWORD = FSUIPC version * 1000 (per FSUIPC spec, BCD), LOWORD = build letter (a=1)
     # Values are configurable via wineUIPC.cfg or XPC_FSUIPC_VERSION / XPC_FSUIPC_BUILD / XPC_FS_VERSION env vars.
     version_x1000 = HANDSHAKE_FSUIPC_VER_X1000
     build_letter = HANDSHAKE_BUILD_LETTER
     fs_version = HANDSHAKE_FS_VERSION
-    _write_u32(0x3304, (version_x1000 << 16) | build_letter)
-    _write_u16(0x3308, fs_version)
-    _write_u16(0x330A, 0xFADE)
+    _write_block(_S_HANDSHAKE, 0x3304, (version_x1000 << 16) | build_letter, fs_version, 0xFADE)
     _write_u16(0x333C, 1 << 1)
     mem[0x3364] = 0
     if not _handshake_logged:
         log(f"FSUIPC handshake version={version_x1000 >> 12}.{(version_x1000 >> 8) & 0xF}{(version_x1000 >> 4) & 0xF}{version_x1000 & 0xF} build=0x{build_letter:04X} fs_ver={fs_version} raw=0x{(version_x1000 << 16) | build_letter:08X}")
         _handshake_logged = True
 
-    local_time_sec = read_float_optional("sim/time/local_time_sec")
-    zulu_time_sec = read_float_optional("sim/time/zulu_time_sec")
+    local_time_sec = R.local_time()
+    zulu_time_sec = R.zulu_time()
     if local_time_sec is None:
         local_time_sec = 0.0
     if zulu_time_sec is None:
         zulu_time_sec = 0.0
     l_hour, l_min, l_sec = _time_hms_from_seconds(local_time_sec)
     z_hour, z_min, _ = _time_hms_from_seconds(zulu_time_sec)
-    _write_u8(0x0238, l_hour)
-    _write_u8(0x0239, l_min)
-    _write_u8(0x023A, l_sec)
-    _write_u8(0x023B, z_hour)
-    _write_u8(0x023C, z_min)
+    _write_block(_S_LOCAL_TIME, 0x0238, l_hour, l_min, l_sec, z_hour, z_min)
 
-    local_date_days = read_int_optional("sim/time/local_date_days")
+    local_date_days = R.local_date_days()
+    today = time.localtime()  # einmal pro Tick statt je Feld
     if local_date_days is None:
-        day_of_year = time.localtime().tm_yday
+        day_of_year = today.tm_yday
     else:
         day_of_year = max(1, min(366, int(local_date_days) + 1))
-    _write_u16(0x023E, day_of_year)
-    _write_u16(0x0240, time.localtime().tm_year)
+    _write_block(_S_DATE, 0x023E, day_of_year, today.tm_year)
 
     offset_secs = local_time_sec - zulu_time_sec
     while offset_secs > 43200:
@@ -641,90 +1008,93 @@ def update_snapshot() -> None:
         offset_secs += 86400
     _write_s16(0x0246, int(round(offset_secs / 60.0)))
 
-    frame_period = read_float_optional("sim/time/framerate_period")
+    frame_period = R.framerate_period()
     if frame_period is None or frame_period <= 0.0:
-        frame_period = read_float_optional("sim/operation/misc/frame_rate_period")
+        frame_period = R.frame_rate_period()
     if frame_period and frame_period > 0.0:
         fps = 1.0 / frame_period
-        fps_div = int(clamp(32768.0 / max(1.0, fps), 0.0, 65535.0))
+        fps_div = int(max(0.0, min(65535.0, 32768.0 / max(1.0, fps))))
         _write_u16(0x0274, fps_div)
 
-    lat = read_double("sim/flightmodel/position/latitude")
-    lon = read_double("sim/flightmodel/position/longitude")
-    alt_m = read_double("sim/flightmodel/position/elevation")
-    indicated_alt_ft = read_float_fallback((
-        "sim/cockpit2/gauges/indicators/altitude_ft_pilot",
-        "sim/flightmodel/misc/h_ind",
-    ), 0.0)
+    lat = R.lat()
+    lon = R.lon()
+    alt_m = R.elevation()
+    indicated_alt_ft = R.indicated_alt_ft()
     altimeter_alt_ft = indicated_alt_ft
-    pitch = read_float("sim/flightmodel/position/theta")
-    roll = read_float("sim/flightmodel/position/phi")
-    heading_mag = read_float("sim/cockpit/autopilot/heading_mag")
+    pitch = R.pitch()
+    roll = R.roll()
+    heading_mag = R.heading_mag()
     if heading_mag == 0.0:
-        heading_mag = read_float("sim/flightmodel/position/psi")
-    gs_mps = read_float("sim/flightmodel/position/groundspeed")
-    tas_mps = read_float("sim/flightmodel/position/true_airspeed")
-    ias_kts = read_float("sim/cockpit2/gauges/indicators/airspeed_kts_pilot")
+        heading_mag = R.psi()
+    gs_mps = R.groundspeed()
+    tas_mps = R.true_airspeed()
+    ias_kts = R.ias_kts()
     if ias_kts <= 0.0:
-        ias_mps_fallback = read_float("sim/flightmodel/position/indicated_airspeed")
+        ias_mps_fallback = R.ias_mps()
         ias_kts = max(0.0, ias_mps_fallback * 1.943844)
-    vs_fpm = read_float("sim/flightmodel/position/vh_ind_fpm")
+    vs_fpm = R.vs_fpm()
     vs_mps = vs_fpm * 0.00508
-    gear_on_ground = read_int_array("sim/flightmodel2/gear/on_ground", 3)
+    R.gear_on_ground()
+    gear_on_ground = _BUF_GEAR_ON_GROUND
     on_ground_any = any(gear_on_ground)
     on_ground = 1 if on_ground_any else 0
-    failure_onground = 1 if read_int("sim/flightmodel/failures/onground_any") else 0
-    log_debug(f"GROUND: gear={gear_on_ground} -> {on_ground}")
-    y_agl = read_float("sim/flightmodel/position/y_agl")
-
-    enc_lat = encode_latitude(lat)
-    enc_lon = encode_longitude(lon)
-    log_debug(f"LAT encode: raw={lat:.6f} enc={enc_lat}")
-    log_debug(f"LON encode: raw={lon:.6f} enc={enc_lon}")
-    _write_s64(0x0560, enc_lat)
-    _write_s64(0x0568, enc_lon)
-    _write_s64(0x0570, encode_altitude_m(alt_m))
-    _write_s32(0x0578, encode_signed_angle32(-pitch))  # FS: + = nose down
-    _write_s32(0x057C, encode_signed_angle32(-roll))   # FS: + = bank left
-    _write_u32(0x0580, encode_angle32(heading_mag % 360.0))
-    compass_heading = read_float_optional("sim/cockpit2/gauges/indicators/heading_electric_deg_mag_pilot")
+    failure_onground = 1 if R.onground_any() else 0
+    if debug:
+        log_debug(f"GROUND: gear={gear_on_ground} -> {on_ground}")
+    y_agl = R.y_agl()
+
+    # 0x0560–0x0583 am Stück; Pitch/Bank: FS + = nose down / bank left
+    position = _encode_position(lat, lon, alt_m, pitch, roll, heading_mag)
+    if debug:
+        log_debug(f"LAT encode: raw={lat:.6f} enc={position[0]}")
+        log_debug(f"LON encode: raw={lon:.6f} enc={position[1]}")
+    _write_block(_S_POSITION, 0x0560, *position)
+    compass_heading = R.compass_heading()
     if compass_heading is None:
         compass_heading = heading_mag
     _write_f64(0x02CC, compass_heading % 360.0)
-    mag_var = read_float("sim/flightmodel/position/magnetic_variation")
-    _write_s16(0x02A0, int(mag_var / 360.0 * 65536.0))
-
-    _write_u32(0x02B4, int(gs_mps * 65536.0))
-    _write_u32(0x02B8, encode_speed_knots128(tas_mps * 1.943844))
-    _write_u32(0x02BC, encode_speed_knots128(ias_kts))
-    _write_u32(0x02C4, encode_speed_knots128(320.0))
-    _write_u32(0x02C8, encode_vs_mps256(vs_mps))
+    mag_var = R.mag_var()
+    _write_s16(0x02A0, int(mag_var / _DIRECTION16_STEP))  # encode_signed_angle16
+
+    # encode_speed_knots128/encode_vs_mps256 inline; VS*256 dient auch als Landerate
+    vs_raw = int(vs_mps * 256.0)
+    _write_block(
+        _S_SPEEDS,
+        0x02B4,
+        int(gs_mps * 65536.0),
+        int(tas_mps * 1.943844 * 128.0) & 0xFFFFFFFF,
+        int(ias_kts * 128.0) & 0xFFFFFFFF,
+    )
+    _write_block(_S_BARBER_VS, 0x02C4, _BARBER_POLE_128, vs_raw & 0xFFFFFFFF)
 
     if on_ground == 0:
         _landing_rate_frozen = False
-        _landing_rate_raw = int(vs_mps * 256.0)
+        _landing_rate_raw = vs_raw
     elif not _landing_rate_frozen and y_agl < 2.0:
-        _landing_rate_raw = int(vs_mps * 256.0)
+        _landing_rate_raw = vs_raw
         _landing_rate_frozen = True
-        log_debug(f"Landing rate captured: {_landing_rate_raw / 256.0 * 60 * 3.28084:.2f} fpm")
+        if debug:
+            log_debug(f"Landing rate captured: {_landing_rate_raw / 256.0 * 60 * 3.28084:.2f} fpm")
     _write_s32(0x030C, _landing_rate_raw)
     _write_u8(0x0366, on_ground)
-    log_verbose(f"GROUND FLAG set to {on_ground}")
+    if verbose:
+        log_verbose(f"GROUND FLAG set to {on_ground}")
     _last_on_ground = on_ground
-    over_g = 1 if read_int("sim/flightmodel/failures/over_g") else 0
+    over_g = 1 if R.over_g() else 0
     landing_rate_fpm = (_landing_rate_raw / 256.0) * 60.0 * 3.28084
     hard_landing = 1 if (_landing_rate_frozen and landing_rate_fpm <= -2500.0) else 0
     crash_flag = 1 if ((over_g and failure_onground) or hard_landing) else 0
     _write_u16(0x0840, crash_flag)
     if crash_flag:
-        log_debug(
-            f"CRASH detected over_g={over_g} onground_fail={failure_onground} "
-            f"landing_rate_fpm={landing_rate_fpm:.1f}"
-        )
+        if debug:
+            log_debug(
+                f"CRASH detected over_g={over_g} onground_fail={failure_onground} "
+                f"landing_rate_fpm={landing_rate_fpm:.1f}"
+            )
 
-    stall_ratio = read_float_optional("sim/cockpit2/annunciators/stall_warning_ratio")
-    stall_annun = read_int_optional("sim/cockpit2/annunciators/stall_warning")
-    stall_fail = read_int_optional("sim/flightmodel/failures/stallwarning")
+    stall_ratio = R.stall_ratio()
+    stall_annun = R.stall_annun()
+    stall_fail = R.stall_fail()
     stall_flag = 0
     if stall_ratio is not None:
         stall_flag = 1 if stall_ratio > 0.05 else 0
@@ -733,97 +1103,196 @@ def update_snapshot() -> None:
     if stall_fail is not None and stall_fail > 0:
         stall_flag = 1
     _write_u8(0x036C, stall_flag)
-    overspeed_pref = read_int_optional("sim/operation/prefs/warn_overspeed")
-    overspeed_vne = read_int_optional("sim/flightmodel/failures/over_vne")
+    overspeed_pref = R.overspeed_pref()
+    overspeed_vne = R.overspeed_vne()
     overspeed_flag = 1 if (overspeed_vne or 0) > 0 else 0
     if overspeed_pref is not None and overspeed_pref == 0:
         overspeed_flag = 0
     _write_u8(0x036D, overspeed_flag)
 
-    paused = 1 if read_int("sim/time/paused") else 0
+    paused = 1 if R.paused() else 0
     _write_u16(0x0262, paused)
     _write_u16(0x0264, paused)
+    _paused_snapshot_done = paused == 1
 
     ground_alt_m = alt_m - y_agl
     coarse, fine = metres_to_fs_ground_alt(ground_alt_m)
     _write_s32(0x0020, coarse)
-    _write_int(0x0B4C, fine, 2, signed=True)
+    _write_s16(0x0B4C, fine)
     _write_u32(0x31E4, int(max(0.0, y_agl) * 65536.0 + 0.5))
 
-    sim_rate_actual = read_float_optional("sim/time/sim_speed_actual")
+    sim_rate_actual = R.sim_speed_actual()
     if sim_rate_actual is None or sim_rate_actual <= 0.0:
-        sim_rate_actual = read_float_fallback(("sim/time/sim_speed",), 1.0)
-    sim_rate = clamp(sim_rate_actual, 0.1, 64.0)
+        sim_rate_actual = R.sim_speed()
+    sim_rate = max(0.1, min(64.0, sim_rate_actual))
     _write_u16(0x0C1A, int(sim_rate * 256.0 + 0.5))
 
+    # Engines
+    R.eng_n1()
+    R.eng_n2()
+    R.eng_running()
+    R.eng_fuel_flow()
+    R.eng_oil_temp()
+    R.eng_oil_press()
+    n1 = _BUF_N1
+    n2 = _BUF_N2
+    eng_running = _BUF_ENG_RUNNING
+    fuel_flow_kg_sec = _BUF_FUEL_FLOW
+    oil_temp = _BUF_OIL_TEMP
+    oil_press = _BUF_OIL_PRESS
+    # die Puffer haben feste Länge 4 → zip statt Index-/Längenprüfung je Feld
+    for (comb_off, ff_off, oil_temp_off), n1_val, n2_val, running, ff_kg_sec, temp_c, press_psi in zip(
+        _ENGINE_SLOTS, n1, n2, eng_running, fuel_flow_kg_sec, oil_temp, oil_press
+    ):
+        if running:
+            n2_units = int(max(0.0, min(110.0, n2_val)) / 100.0 * 16384.0)
+            n1_units = int(max(0.0, min(110.0, n1_val)) / 100.0 * 16384.0)
+            combust = 1
+        else:
+            n2_units = n1_units = 0xFFFF
+            combust = 0
+        # comb/N2/N1 liegen direkt hintereinander (comb_off, n2_off, n1_off); N ≤ 110 % → < 0xFFFF,
+        # also direkt packen statt über die Sättigungs-Hülle von _write_block
+        _S_ENGINE_GAUGES.pack_into(mem, comb_off, combust, n2_units, n1_units)
+        # auf 0..65535 begrenzt → passt immer in u32, keine Sättigung nötig
+        _S_U32.pack_into(mem, ff_off, int(max(0.0, min(65535.0, ff_kg_sec * KG_TO_LBS * 3600.0))))
+        _write_block(
+            _S_ENGINE_OIL,
+            oil_temp_off,
+            int(max(-273.0, min(999.0, temp_c * 9.0 / 5.0 + 32.0)) / 140.0 * 16384.0),
+            int(max(0.0, min(220.0, press_psi)) / 55.0 * 16384.0),
+        )
+    engine_count = R.num_engines()
+    if engine_count <= 0:
+        engine_count = len(n1)
+    engine_count = max(1, min(engine_count, len(_ENGINE_SLOTS)))
+    _write_u16(0x0AEC, engine_count)
+
+    # Altimeter / barometer settings
+    baro_inhg = R.baro_inhg()
+    baro_hpa = baro_inhg * 33.8638866667
+    _write_block(
+        _S_BARO,
+        0x0330,
+        int(max(0.0, min(2000.0, baro_hpa)) * 16.0 + 0.5),
+        int(max(0.0, min(60.0, baro_inhg)) * 16.0 + 0.5),
+    )
+
+    if FSAIRLINES_COMPAT:
+        altimeter_alt_ft = indicated_alt_ft + (29.92 - baro_inhg) * 1000.0
+
+    _write_s32(0x3324, int(altimeter_alt_ft))
+
+    standby_baro_inhg = R.baro_copilot()
+    if standby_baro_inhg is None:
+        standby_baro_inhg = R.baro_stby()
+    if standby_baro_inhg is None:
+        standby_baro_inhg = baro_inhg
+    standby_baro_hpa = standby_baro_inhg * 33.8638866667
+    _write_u16(0x3542, int(max(0.0, min(2000.0, standby_baro_hpa)) * 16.0 + 0.5))
+
+    if FSAIRLINES_COMPAT:
+        standby_alt_ft = altimeter_alt_ft
+    else:
+        standby_alt_ft = R.alt_copilot()
+        if standby_alt_ft is None:
+            standby_alt_ft = altimeter_alt_ft
+    _write_s32(0x3544, int(standby_alt_ft))
+
+    if verbose:
+        log_verbose(
+            f"ALTIMETER main={baro_hpa:.1f} hPa/{baro_inhg:.2f} inHg alt={altimeter_alt_ft:.0f}ft "
+            f"stdby={standby_baro_hpa:.1f} hPa/{standby_baro_inhg:.2f} inHg alt={standby_alt_ft:.0f}ft"
+        )
+
+    # G-force (normal)
+    g_force = max(-8.0, min(8.0, R.gforce()))
+    g_units = int(g_force * 625.0)
+    _write_block(_S_GFORCE, 0x11B8, g_units, g_units)
+
+    if full:
+        _update_slow_fields(R, mag_var, ground_alt_m)
+    return True
+
+
+def _update_slow_fields(R: Any, mag_var: float, ground_alt_m: float) -> None:
+    global _prev_xpdr_code, _prev_xpdr_mode
+    debug = _DEBUG
+    verbose = _VERBOSE
     # Lights
-    nav_on = 1 if read_int("sim/cockpit2/switches/navigation_lights_on") else 0
-    beacon_on = 1 if read_int("sim/cockpit2/switches/beacon_on") else 0
-    strobe_on = 1 if read_int("sim/cockpit2/switches/strobe_lights_on") else 0
-    landing_on = 1 if read_int("sim/cockpit2/switches/landing_lights_on") else 0
-    taxi_on = 1 if read_int("sim/cockpit2/switches/taxi_light_on") else 0
-    panel_ratios = read_array("sim/cockpit2/switches/panel_brightness_ratio", 4)
+    nav_on = 1 if R.nav_lights() else 0
+    beacon_on = 1 if R.beacon() else 0
+    strobe_on = 1 if R.strobe() else 0
+    landing_on = 1 if R.landing_lights() else 0
+    taxi_on = 1 if R.taxi_light() else 0
+    R.panel_brightness()
+    panel_ratios = _BUF_PANEL_BRIGHTNESS
     panel_ratio = max(panel_ratios) if panel_ratios else 0.0
     panel_on = 1 if panel_ratio > 0.1 else 0
-    _write_u8(0x0280, nav_on)
-    _write_u8(0x0281, 1 if (beacon_on or strobe_on) else 0)
+    _write_block(_S_LIGHTS, 0x0280, nav_on, 1 if (beacon_on or strobe_on) else 0)
     _write_u8(0x028C, landing_on)
-    log_debug(
-        f"LIGHTS nav={nav_on} beacon={beacon_on} strobe={strobe_on} "
-        f"landing={landing_on} taxi={taxi_on} panel={panel_on}"
-    )
+    if debug:
+        log_debug(
+            f"LIGHTS nav={nav_on} beacon={beacon_on} strobe={strobe_on} "
+            f"landing={landing_on} taxi={taxi_on} panel={panel_on}"
+        )
 
-    lights_bits = 0
-    lights_bits |= nav_on << 0
-    lights_bits |= beacon_on << 1
-    lights_bits |= landing_on << 2
-    lights_bits |= taxi_on << 3
-    lights_bits |= strobe_on << 4
-    lights_bits |= panel_on << 5
-    lights_bits |= nav_on << 6  # recognition
-    lights_bits |= nav_on << 7  # wing
-    lights_bits |= nav_on << 8  # logo
-    lights_bits |= nav_on << 9  # cabin
+    # Nav schaltet auch Recognition/Wing/Logo/Cabin (Bits 6–9) → ein Produkt mit 0x3C1 statt vier Shifts
+    lights_bits = (
+        nav_on * _LIGHTS_NAV_MASK
+        | beacon_on << 1
+        | landing_on << 2
+        | taxi_on << 3
+        | strobe_on << 4
+        | panel_on << 5
+    )
     _write_u16(0x0D0C, lights_bits)
 
     # Parking brake
-    brake_ratio = clamp(read_float("sim/flightmodel/controls/parkbrake"), 0.0, 1.0)
+    brake_ratio = clamp(R.parkbrake(), 0.0, 1.0)
     _write_u16(0x0BC8, int(brake_ratio * 32767.0))
 
     # Flaps / Spoilers
-    flap_ratio = clamp(read_float("sim/flightmodel/controls/flaprat"), 0.0, 1.0)
-    spoiler_ratio = clamp(read_float("sim/flightmodel/controls/sbrkrat"), 0.0, 1.0)
+    flap_ratio = clamp(R.flap_ratio(), 0.0, 1.0)
+    spoiler_ratio = clamp(R.spoiler_ratio(), 0.0, 1.0)
     flap_units = int(flap_ratio * 16383.0)
     spoiler_units = int(spoiler_ratio * 16383.0)
-    _write_u32(0x0BDC, flap_units)
-    _write_u32(0x0BE0, flap_units)
-    _write_u32(0x0BE4, flap_units)
-    _write_u32(0x0BD0, spoiler_units)
-    left_def = read_float("sim/flightmodel/controls/lsplrdef")
-    right_def = read_float("sim/flightmodel/controls/rsplrdef")
-    _write_u32(0x0BD4, _spoiler_deg_to_units(left_def))
-    _write_u32(0x0BD8, _spoiler_deg_to_units(right_def))
-    speedbrake_ratio = read_float("sim/cockpit2/controls/speedbrake_ratio")
+    left_def = R.spoiler_left_deg()
+    right_def = R.spoiler_right_deg()
+    speedbrake_ratio = R.speedbrake_ratio()
     spoiler_arm = 1 if speedbrake_ratio < 0.0 else 0
-    _write_u32(0x0BCC, 4800 if spoiler_arm else 0)
-    log_debug(
-        f"SPOILERS cmd_ratio={spoiler_ratio:.2f} left_deg={left_def:.1f} "
-        f"right_deg={right_def:.1f}"
+    _write_block(
+        _S_FLAPS_SPOILERS,
+        0x0BCC,
+        4800 if spoiler_arm else 0,
+        spoiler_units,
+        _spoiler_deg_to_units(left_def),
+        _spoiler_deg_to_units(right_def),
+        flap_units,
+        flap_units,
+        flap_units,
     )
+    if debug:
+        log_debug(
+            f"SPOILERS cmd_ratio={spoiler_ratio:.2f} left_deg={left_def:.1f} "
+            f"right_deg={right_def:.1f}"
+        )
 
     # Gear
-    gear_handle = read_int("sim/cockpit2/controls/gear_handle_down")
+    gear_handle = R.gear_handle_down()
     _write_u16(0x0BE8, 1 if gear_handle else 0)
-    log_debug(f"GEAR HANDLE: {gear_handle}")
-    has_retract = read_float("sim/aircraft/gear/acf_gear_retract")
+    if debug:
+        log_debug(f"GEAR HANDLE: {gear_handle}")
+    has_retract = R.gear_retract()
     if has_retract >= 1.0:
         gear_flags = 1
     else:
         gear_flags = 0
-    _write_u16(0x060C, gear_flags)
-    _write_u16(0x060E, gear_flags)
-    log_verbose(f"GEAR TYPE: retract_ref={has_retract:.1f} fsuipc={gear_flags}")
-    deploy = read_array("sim/flightmodel2/gear/deploy_ratio", 3)
+    _write_block(_S_GEAR_TYPE, 0x060C, gear_flags, gear_flags)
+    if verbose:
+        log_verbose(f"GEAR TYPE: retract_ref={has_retract:.1f} fsuipc={gear_flags}")
+    R.gear_deploy()
+    deploy = _BUF_GEAR_DEPLOY
     deploy_offsets = (0x0C34, 0x0C30, 0x0C38)
     all_down = True
     for idx, off in enumerate(deploy_offsets):
@@ -836,56 +1305,22 @@ def update_snapshot() -> None:
     left = deploy[0] if len(deploy) > 0 else 0.0
     right = deploy[1] if len(deploy) > 1 else 0.0
     nose = deploy[2] if len(deploy) > 2 else 0.0
-    log_debug(f"GEAR DEPLOY: mainL={left:.2f} mainR={right:.2f} nose={nose:.2f} all_down={all_down}")
-
-    # Engines
-    n1 = read_array("sim/flightmodel/engine/ENGN_N1_", 4)
-    n2 = read_array("sim/flightmodel/engine/ENGN_N2_", 4)
-    eng_running = read_int_array("sim/flightmodel/engine/ENGN_running", 4)
-    fuel_flow_kg_sec = read_array("sim/cockpit2/engine/indicators/fuel_flow_kg_sec", 4)
-    oil_temp = read_array("sim/cockpit2/engine/indicators/oil_temperature_deg_C", 4)
-    oil_press = read_array("sim/cockpit2/engine/indicators/oil_pressure_psi", 4)
-    engine_slots = (
-        (0x0894, 0x0896, 0x0898, 0x090A, 0x08B8, 0x08BA),
-        (0x092C, 0x092E, 0x0930, 0x0942, 0x0950, 0x0952),
-        (0x09C4, 0x09C6, 0x09C8, 0x09DA, 0x09E8, 0x09EA),
-        (0x0A5C, 0x0A5E, 0x0A60, 0x0A72, 0x0A80, 0x0A82),
-    )
-    for idx, (comb_off, n2_off, n1_off, ff_off, oil_temp_off, oil_press_off) in enumerate(engine_slots):
-        _write_u16(n2_off, 0xFFFF)
-        _write_u16(n1_off, 0xFFFF)
-        n1_val = n1[idx] if idx < len(n1) else 0.0
-        n2_val = n2[idx] if idx < len(n2) else 0.0
-        ff_kg_sec = fuel_flow_kg_sec[idx] if idx < len(fuel_flow_kg_sec) else 0.0
-        temp_c = oil_temp[idx] if idx < len(oil_temp) else 0.0
-        press_psi = oil_press[idx] if idx < len(oil_press) else 0.0
-        running = eng_running[idx] if idx < len(eng_running) else 0
-        if running:
-            _write_u16(n2_off, int(clamp(n2_val, 0.0, 110.0) / 100.0 * 16384.0))
-            _write_u16(n1_off, int(clamp(n1_val, 0.0, 110.0) / 100.0 * 16384.0))
-        combust = 1 if running else 0
-        _write_u16(comb_off, combust)
-        lbs_per_hr = clamp(ff_kg_sec * KG_TO_LBS * 3600.0, 0.0, 65535.0)
-        _write_u32(ff_off, int(lbs_per_hr))
-        _write_u16(oil_temp_off, int(clamp(temp_c * 9.0 / 5.0 + 32.0, -273.0, 999.0) / 140.0 * 16384.0))
-        _write_u16(oil_press_off, int(clamp(press_psi, 0.0, 220.0) / 55.0 * 16384.0))
-    engine_count = read_int("sim/aircraft/engine/acf_num_engines")
-    if engine_count <= 0:
-        engine_count = len(n1) if n1 else 1
-    engine_count = max(1, min(engine_count, len(engine_slots)))
-    _write_u16(0x0AEC, engine_count)
+    if debug:
+        log_debug(f"GEAR DEPLOY: mainL={left:.2f} mainR={right:.2f} nose={nose:.2f} all_down={all_down}")
 
     # Fuel / Weights
-    fuel_total_kg = max(0.0, read_float("sim/flightmodel/weight/m_fuel_total"))
-    fuel_capacity_lbs = read_float_fallback(("sim/aircraft/weight/acf_m_fuel_tot",), 0.0)
+    fuel_total_kg = max(0.0, R.fuel_total())
+    fuel_capacity_lbs = R.fuel_capacity_lbs()
     fuel_capacity_kg = fuel_capacity_lbs / KG_TO_LBS if fuel_capacity_lbs > 0.0 else 0.0
     if fuel_capacity_kg <= 1.0:
         fuel_capacity_kg = 3000.0  # reasonable default to avoid zero-capacity edge cases
     fuel_pct = fuel_total_kg / fuel_capacity_kg if fuel_capacity_kg > 0.0 else 0.0
     fuel_pct = clamp(fuel_pct, 0.0, 1.0)
 
-    fuel_tanks_kg = read_array("sim/flightmodel/weight/m_fuel", 9)
-    fuel_caps_kg = [0.0] * 9
+    R.fuel_tanks()
+    fuel_tanks_kg = _BUF_FUEL_TANKS
+    fuel_caps_kg = _BUF_FUEL_CAPS
+    fuel_caps_kg[:] = _NO_FUEL_CAPS
     has_tank_caps = False
     has_tank_levels = any(val > 0.0 for val in fuel_tanks_kg)
 
@@ -893,32 +1328,13 @@ def update_snapshot() -> None:
         total_levels = sum(max(0.0, v) for v in fuel_tanks_kg)
         if fuel_capacity_kg > 0.0:
             if total_levels > 0.0:
-                fuel_caps_kg = [
-                    max(0.0, v) / total_levels * fuel_capacity_kg for v in fuel_tanks_kg
-                ]
+                for idx, v in enumerate(fuel_tanks_kg):
+                    fuel_caps_kg[idx] = max(0.0, v) / total_levels * fuel_capacity_kg
             else:
-                fuel_caps_kg = [0.0] * len(fuel_tanks_kg)
                 fuel_caps_kg[0] = fuel_capacity_kg / 2.0
-                if len(fuel_caps_kg) > 1:
-                    fuel_caps_kg[1] = fuel_capacity_kg / 2.0
+                fuel_caps_kg[1] = fuel_capacity_kg / 2.0
         has_tank_caps = any(val > 0.0 for val in fuel_caps_kg)
 
-    def tank_units(mass_kg: float, cap_kg: float, total_cap_kg: float) -> int:
-        if cap_kg > 0.0:
-            pct = mass_kg / cap_kg
-        elif total_cap_kg > 0.0:
-            pct = mass_kg / total_cap_kg
-        else:
-            pct = 0.0
-        return int(clamp(pct, 0.0, 1.0) * 128.0 * 65536.0)
-
-    def cap_to_gal(cap_kg: float) -> int:
-        if cap_kg <= 0.0:
-            return 0
-        cap_lbs = cap_kg * KG_TO_LBS
-        cap_gal = cap_lbs / FUEL_LBS_PER_GAL
-        return int(max(0.0, min(cap_gal, (2**32 - 1))) + 0.5)
-
     if has_tank_levels or has_tank_caps:
         # X-Plane tank order (best effort): 0=L main, 1=R main, 2=L aux, 3=R aux, 4-6=center, 7=L tip, 8=R tip
         left_main_kg = fuel_tanks_kg[0] if len(fuel_tanks_kg) > 0 else 0.0
@@ -937,68 +1353,63 @@ def update_snapshot() -> None:
         left_tip_cap = fuel_caps_kg[7] if len(fuel_caps_kg) > 7 else 0.0
         right_tip_cap = fuel_caps_kg[8] if len(fuel_caps_kg) > 8 else 0.0
 
-        _write_u32(0x0B7C, tank_units(left_main_kg, left_main_cap, fuel_capacity_kg))
-        _write_u32(0x0B94, tank_units(right_main_kg, right_main_cap, fuel_capacity_kg))
-        _write_u32(0x0B74, tank_units(center_kg, center_cap, fuel_capacity_kg))
-        _write_u32(0x0B84, tank_units(left_aux_kg, left_aux_cap, fuel_capacity_kg))
-        _write_u32(0x0B9C, tank_units(right_aux_kg, right_aux_cap, fuel_capacity_kg))
-        _write_u32(0x0B8C, tank_units(left_tip_kg, left_tip_cap, fuel_capacity_kg))
-        _write_u32(0x0BA4, tank_units(right_tip_kg, right_tip_cap, fuel_capacity_kg))
-
-        _write_u32(0x0B80, cap_to_gal(left_main_cap))
-        _write_u32(0x0B98, cap_to_gal(right_main_cap))
-        _write_u32(0x0B78, cap_to_gal(center_cap))
-        _write_u32(0x0B88, cap_to_gal(left_aux_cap))
-        _write_u32(0x0BA0, cap_to_gal(right_aux_cap))
-        _write_u32(0x0B90, cap_to_gal(left_tip_cap))
-        _write_u32(0x0BA8, cap_to_gal(right_tip_cap))
+        _write_block(
+            _S_FUEL_TANKS,
+            0x0B74,
+            _fuel_tank_units(center_kg, center_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(center_cap),
+            _fuel_tank_units(left_main_kg, left_main_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(left_main_cap),
+            _fuel_tank_units(left_aux_kg, left_aux_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(left_aux_cap),
+            _fuel_tank_units(left_tip_kg, left_tip_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(left_tip_cap),
+            _fuel_tank_units(right_main_kg, right_main_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(right_main_cap),
+            _fuel_tank_units(right_aux_kg, right_aux_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(right_aux_cap),
+            _fuel_tank_units(right_tip_kg, right_tip_cap, fuel_capacity_kg),
+            _fuel_cap_to_gal(right_tip_cap),
+        )
 
-        log_verbose(
-            "FUEL TANKS L=%.0fkg R=%.0fkg LA=%.0fkg RA=%.0fkg LT=%.0fkg RT=%.0fkg C=%.0fkg caps L=%.0fkg R=%.0fkg LA=%.0fkg RA=%.0fkg LT=%.0fkg RT=%.0fkg C=%.0fkg"
-            % (
-                left_main_kg,
-                right_main_kg,
-                left_aux_kg,
-                right_aux_kg,
-                left_tip_kg,
-                right_tip_kg,
-                center_kg,
-                left_main_cap,
-                right_main_cap,
-                left_aux_cap,
-                right_aux_cap,
-                left_tip_cap,
-                right_tip_cap,
-                center_cap,
+        if verbose:
+            log_verbose(
+                "FUEL TANKS L=%.0fkg R=%.0fkg LA=%.0fkg RA=%.0fkg LT=%.0fkg RT=%.0fkg C=%.0fkg caps L=%.0fkg R=%.0fkg LA=%.0fkg RA=%.0fkg LT=%.0fkg RT=%.0fkg C=%.0fkg"
+                % (
+                    left_main_kg,
+                    right_main_kg,
+                    left_aux_kg,
+                    right_aux_kg,
+                    left_tip_kg,
+                    right_tip_kg,
+                    center_kg,
+                    left_main_cap,
+                    right_main_cap,
+                    left_aux_cap,
+                    right_aux_cap,
+                    left_tip_cap,
+                    right_tip_cap,
+                    center_cap,
+                )
             )
-        )
     else:
         fuel_units = int(clamp(fuel_pct, 0.0, 1.0) * 128.0 * 65536.0)
-        _write_u32(0x0B7C, fuel_units)  # left main level
-        _write_u32(0x0B94, fuel_units)  # right main level
-        _write_u32(0x0B74, 0)           # center tank level (unused default)
         # Capacities in US gallons (distribute evenly across L/R, mirror to center)
         fuel_capacity_lbs = fuel_capacity_kg * KG_TO_LBS
         fuel_capacity_gal = fuel_capacity_lbs / FUEL_LBS_PER_GAL if fuel_capacity_lbs > 0.0 else 0.0
         per_tank_gal = fuel_capacity_gal / 2.0 if fuel_capacity_gal > 0.0 else 0.0
         cap_u32 = int(max(0.0, min(per_tank_gal, (2**32 - 1))) + 0.5)
-        _write_u32(0x0B80, cap_u32)  # left main capacity
-        _write_u32(0x0B98, cap_u32)  # right main capacity
-        _write_u32(0x0B78, 0)        # center capacity unused by default
+        # center level/capacity unused by default, left + right main level/capacity
+        _write_block(_S_FUEL_LEFT, 0x0B74, 0, 0, fuel_units, cap_u32)
+        _write_block(_S_FUEL_RIGHT, 0x0B94, fuel_units, cap_u32)
     _write_u16(0x0AF4, int(FUEL_LBS_PER_GAL * 256.0 + 0.5))
 
-    empty_mass_kg = max(0.0, read_float_fallback((
-        "sim/flightmodel/weight/m_fixed",
-        "sim/aircraft/weight/acf_m_empty",
-    ), 0.0))
-    total_mass_kg = max(0.0, read_float_optional("sim/flightmodel/weight/m_total") or 0.0)
+    empty_mass_kg = max(0.0, R.empty_mass_kg())
+    total_mass_kg = max(0.0, R.total_mass() or 0.0)
     payload_kg = max(0.0, total_mass_kg - fuel_total_kg - empty_mass_kg)
     zfw_kg = empty_mass_kg + payload_kg
     total_mass_kg = zfw_kg + fuel_total_kg
-    max_gross_kg = read_float_fallback((
-        "sim/flightmodel/weight/m_max",
-        "sim/aircraft/weight/acf_m_max",
-    ), 0.0)
+    max_gross_kg = R.max_gross_kg()
 
     zfw_lbs = zfw_kg * KG_TO_LBS
     fuel_lbs = fuel_total_kg * KG_TO_LBS
@@ -1006,8 +1417,8 @@ def update_snapshot() -> None:
     payload_lbs = payload_kg * KG_TO_LBS
     max_gross_lbs = max_gross_kg * KG_TO_LBS if max_gross_kg > 0.0 else 0.0
 
-    _write_f64(0x30C0, total_lbs)  # current loaded weight in lbs (FSUIPC spec)
-    _write_f64(0x30C8, total_lbs / 32.174049 if total_lbs > 0.0 else 0.0)  # mass in slugs
+    # current loaded weight in lbs (FSUIPC spec), mass in slugs
+    _write_block(_S_WEIGHTS, 0x30C0, float(total_lbs), total_lbs / 32.174049 if total_lbs > 0.0 else 0.0)
     zfw_scaled = int(clamp(zfw_lbs, 0.0, (2**32 - 1) / 256.0) * 256.0 + 0.5)
     _write_u32(0x3BFC, zfw_scaled)
     if max_gross_lbs > 0.0:
@@ -1015,39 +1426,34 @@ def update_snapshot() -> None:
         _write_u32(0x1334, max_gross_scaled)
         _write_f64(0x1260, max_gross_lbs)
 
-    log_verbose(
-        "WEIGHTS fuel=%.1fkg(%.1f%%) payload=%.1fkg/%.0flb zfw=%.1fkg/%.0flb gw=%.1fkg/%.0flb max_gw=%.1fkg/%.0flb"
-        % (
-            fuel_total_kg,
-            fuel_pct * 100.0,
-            payload_kg,
-            payload_lbs,
-            zfw_kg,
-            zfw_lbs,
-            total_mass_kg,
-            total_lbs,
-            max_gross_kg,
-            max_gross_lbs,
+    if verbose:
+        log_verbose(
+            "WEIGHTS fuel=%.1fkg(%.1f%%) payload=%.1fkg/%.0flb zfw=%.1fkg/%.0flb gw=%.1fkg/%.0flb max_gw=%.1fkg/%.0flb"
+            % (
+                fuel_total_kg,
+                fuel_pct * 100.0,
+                payload_kg,
+                payload_lbs,
+                zfw_kg,
+                zfw_lbs,
+                total_mass_kg,
+                total_lbs,
+                max_gross_kg,
+                max_gross_lbs,
+            )
         )
-    )
 
     # Cabin signs (best effort)
     seatbelt_mode = _resolve_cabin_sign("seatbelt")
     nosmoke_mode = _resolve_cabin_sign("nosmoke")
-    _write_u8(0x3414, int(seatbelt_mode))
-    _write_u8(0x3415, int(nosmoke_mode))
-    log_verbose(f"CABIN SIGNS seatbelt={seatbelt_mode} nosmoke={nosmoke_mode}")
+    _write_block(_S_CABIN_SIGNS, 0x3414, int(seatbelt_mode), int(nosmoke_mode))
+    if verbose:
+        log_verbose(f"CABIN SIGNS seatbelt={seatbelt_mode} nosmoke={nosmoke_mode}")
 
-    xpdr_code = clamp(read_int_fallback((
-        "sim/cockpit2/radios/actuators/transponder_code",
-        "sim/cockpit/radios/transponder_code",
-    )), 0, 7777)
+    xpdr_code = clamp(R.xpdr_code(), 0, 7777)
     encoded_code = encode_bcd4(int(xpdr_code), octal=True)
     _write_u16(0x0354, encoded_code)
-    xpdr_mode = clamp(read_int_fallback((
-        "sim/cockpit/radios/transponder_mode",
-        "sim/cockpit2/radios/actuators/transponder_mode",
-    )), 0, 4)
+    xpdr_mode = clamp(R.xpdr_mode(), 0, 4)
     if xpdr_mode <= 0:
         fs_mode = 0  # OFF
     elif xpdr_mode == 1:
@@ -1060,7 +1466,8 @@ def update_snapshot() -> None:
     _write_u8(0x0B46, fs_mode)
     _write_u8(0x7B91, fs_mode)
     if _prev_xpdr_code != encoded_code or _prev_xpdr_mode != fs_mode:
-        log_debug(f"XPDR code={xpdr_code:04d} encoded=0x{encoded_code:04X} mode={fs_mode}")
+        if debug:
+            log_debug(f"XPDR code={xpdr_code:04d} encoded=0x{encoded_code:04X} mode={fs_mode}")
         _prev_xpdr_code = encoded_code
         _prev_xpdr_mode = fs_mode
 
@@ -1074,29 +1481,29 @@ def update_snapshot() -> None:
     com2_active_bcd = encode_com_freq(com2_active)
     com2_stby_bcd = encode_com_freq(com2_stby)
     _write_u16(0x034E, com1_active_bcd)
-    _write_u16(0x311A, com1_stby_bcd)
-    _write_u16(0x3118, com2_active_bcd)
-    _write_u16(0x311C, com2_stby_bcd)
-    log_verbose(
-        "COM RADIOS com1=%.3f(0x%04X)/%.3f(0x%04X) com2=%.3f(0x%04X)/%.3f(0x%04X)"
-        % (
-            com1_active,
-            com1_active_bcd,
-            com1_stby,
-            com1_stby_bcd,
-            com2_active,
-            com2_active_bcd,
-            com2_stby,
-            com2_stby_bcd,
+    _write_block(_S_COM_STBY, 0x3118, com2_active_bcd, com1_stby_bcd, com2_stby_bcd)
+    if verbose:
+        log_verbose(
+            "COM RADIOS com1=%.3f(0x%04X)/%.3f(0x%04X) com2=%.3f(0x%04X)/%.3f(0x%04X)"
+            % (
+                com1_active,
+                com1_active_bcd,
+                com1_stby,
+                com1_stby_bcd,
+                com2_active,
+                com2_active_bcd,
+                com2_stby,
+                com2_stby_bcd,
+            )
+        )
+    if debug:
+        log_debug(
+            f"COM SRC com1_act={src1a or 'none'} com1_stby={src1s or 'none'} "
+            f"com2_act={src2a or 'none'} com2_stby={src2s or 'none'}"
         )
-    )
-    log_debug(
-        f"COM SRC com1_act={src1a or 'none'} com1_stby={src1s or 'none'} "
-        f"com2_act={src2a or 'none'} com2_stby={src2s or 'none'}"
-    )
 
-    nav1_hz = _read_number_optional("sim/cockpit/radios/nav1_freq_hz")
-    nav2_hz = _read_number_optional("sim/cockpit/radios/nav2_freq_hz")
+    nav1_hz = R.nav1_hz()
+    nav2_hz = R.nav2_hz()
     if nav1_hz is not None:
         nav1_mhz = float(nav1_hz) / 100.0
         _write_u16(0x0350, encode_com_freq(nav1_mhz))
@@ -1104,54 +1511,54 @@ def update_snapshot() -> None:
         nav2_mhz = float(nav2_hz) / 100.0
         _write_u16(0x0352, encode_com_freq(nav2_mhz))
 
-    adf1_hz = _read_number_optional("sim/cockpit/radios/adf1_freq_hz")
+    adf1_hz = R.adf1_hz()
     if adf1_hz is not None:
         adf1_khz = float(adf1_hz) * 10.0
         adf1_main, adf1_ext = encode_adf_freq(adf1_khz)
         _write_u16(0x034C, adf1_main)
         _write_u16(0x0356, adf1_ext)
 
-    adf2_hz = _read_number_optional("sim/cockpit/radios/adf2_freq_hz")
+    adf2_hz = R.adf2_hz()
     if adf2_hz is not None:
         adf2_khz = float(adf2_hz) * 10.0
         adf2_main, adf2_ext = encode_adf_freq(adf2_khz)
         _write_u16(0x02D4, adf2_main)
         _write_u16(0x02D6, adf2_ext)
-    adf2_dir = read_float_optional("sim/cockpit/radios/adf2_dir_degt")
+    adf2_dir = R.adf2_dir()
     if adf2_dir is not None:
         rel = ((adf2_dir + 180.0) % 360.0) - 180.0
-        _write_s16(0x02D8, int(rel / 360.0 * 65536.0))
+        _write_s16(0x02D8, encode_signed_angle16(rel))
 
-    nav1_dme_nm = read_float_optional("sim/cockpit/radios/nav1_dme_dist_m")
+    nav1_dme_nm = R.nav1_dme_dist()
     if nav1_dme_nm is not None:
         _write_u16(0x0300, int(clamp(nav1_dme_nm * 10.0, 0.0, 65535.0) + 0.5))
-    nav1_dme_spd = read_float_optional("sim/cockpit/radios/nav1_dme_speed_kts")
+    nav1_dme_spd = R.nav1_dme_speed()
     if nav1_dme_spd is not None:
         _write_u16(0x0302, int(clamp(nav1_dme_spd * 10.0, 0.0, 65535.0) + 0.5))
-    nav1_dme_time_min = read_float_optional("sim/cockpit/radios/nav1_dme_time_secs")
+    nav1_dme_time_min = R.nav1_dme_time()
     if nav1_dme_time_min is not None:
         _write_u16(0x0304, int(clamp(nav1_dme_time_min * 60.0 * 10.0, 0.0, 65535.0) + 0.5))
 
-    nav2_dme_nm = read_float_optional("sim/cockpit/radios/nav2_dme_dist_m")
+    nav2_dme_nm = R.nav2_dme_dist()
     if nav2_dme_nm is not None:
         _write_u16(0x0306, int(clamp(nav2_dme_nm * 10.0, 0.0, 65535.0) + 0.5))
-    nav2_dme_spd = read_float_optional("sim/cockpit/radios/nav2_dme_speed_kts")
+    nav2_dme_spd = R.nav2_dme_speed()
     if nav2_dme_spd is not None:
         _write_u16(0x0308, int(clamp(nav2_dme_spd * 10.0, 0.0, 65535.0) + 0.5))
-    nav2_dme_time_min = read_float_optional("sim/cockpit/radios/nav2_dme_time_secs")
+    nav2_dme_time_min = R.nav2_dme_time()
     if nav2_dme_time_min is not None:
         _write_u16(0x030A, int(clamp(nav2_dme_time_min * 60.0 * 10.0, 0.0, 65535.0) + 0.5))
 
-    ap_type = read_int_optional("sim/aircraft/autopilot/preconfigured_ap_type")
+    ap_type = R.ap_type()
     _write_u32(0x0764, 1 if ap_type and ap_type > 0 else 0)
 
-    ap_alt_ft = read_float_optional("sim/cockpit/autopilot/altitude")
+    ap_alt_ft = R.ap_altitude()
     if ap_alt_ft is not None:
         ap_alt_m = ap_alt_ft * 0.3048
         _write_u32(0x07D4, int(clamp(ap_alt_m, -32768.0, 32767.0) * 65536.0))
 
-    ap_airspeed = read_float_optional("sim/cockpit/autopilot/airspeed")
-    ap_is_mach = read_int_optional("sim/cockpit/autopilot/airspeed_is_mach")
+    ap_airspeed = R.ap_airspeed()
+    ap_is_mach = R.ap_is_mach()
     if ap_airspeed is not None:
         if ap_is_mach:
             _write_u32(0x07E8, int(clamp(ap_airspeed, 0.0, 4.0) * 65536.0))
@@ -1159,73 +1566,36 @@ def update_snapshot() -> None:
             _write_u16(0x07E2, int(clamp(ap_airspeed, 0.0, 999.0) + 0.5))
 
     # Avionics master
-    avionics_sources = read_int_array("sim/cockpit2/switches/avionics_power_on", 2)
-    avionics_on = 1 if any(avionics_sources) else read_int("sim/cockpit/electrical/avionics_on")
+    R.avionics_sources()
+    avionics_sources = _BUF_AVIONICS_SOURCES
+    avionics_on = 1 if any(avionics_sources) else R.avionics_on()
     _write_u32(0x2E80, 1 if avionics_on else 0)
-    log_verbose(f"AVIONICS power={avionics_on}")
+    if verbose:
+        log_verbose(f"AVIONICS power={avionics_on}")
 
     # Battery master
-    battery_sources = read_int_array("sim/cockpit2/electrical/battery_on", 4)
-    battery_on = 1 if any(battery_sources) else read_int("sim/cockpit/electrical/battery_on")
+    R.battery_sources()
+    battery_sources = _BUF_BATTERY_SOURCES
+    battery_on = 1 if any(battery_sources) else R.battery_on()
     _write_u32(0x281C, 1 if battery_on else 0)
-    log_verbose(f"BATTERY power={battery_on}")
-
-    # Altimeter / barometer settings
-    baro_inhg = read_float_fallback((
-        "sim/cockpit2/gauges/actuators/barometer_setting_in_hg_pilot",
-        "sim/cockpit/misc/barometer_setting",
-    ), 29.92)
-    baro_hpa = baro_inhg * 33.8638866667
-    _write_u16(0x0330, int(clamp(baro_hpa, 0.0, 2000.0) * 16.0 + 0.5))
-    _write_u16(0x0332, int(clamp(baro_inhg, 0.0, 60.0) * 16.0 + 0.5))
-
-    if FSAIRLINES_COMPAT:
-        altimeter_alt_ft = indicated_alt_ft + (29.92 - baro_inhg) * 1000.0
-
-    _write_s32(0x3324, int(altimeter_alt_ft))
-
-    standby_baro_inhg = read_float_optional("sim/cockpit2/gauges/actuators/barometer_setting_in_hg_copilot")
-    if standby_baro_inhg is None:
-        standby_baro_inhg = read_float_optional("sim/cockpit2/gauges/actuators/barometer_setting_in_hg_stby")
-    if standby_baro_inhg is None:
-        standby_baro_inhg = baro_inhg
-    standby_baro_hpa = standby_baro_inhg * 33.8638866667
-    _write_u16(0x3542, int(clamp(standby_baro_hpa, 0.0, 2000.0) * 16.0 + 0.5))
-
-    if FSAIRLINES_COMPAT:
-        standby_alt_ft = altimeter_alt_ft
-    else:
-        standby_alt_ft = read_float_optional("sim/cockpit2/gauges/indicators/altitude_ft_copilot")
-        if standby_alt_ft is None:
-            standby_alt_ft = altimeter_alt_ft
-    _write_s32(0x3544, int(standby_alt_ft))
-
-    log_verbose(
-        f"ALTIMETER main={baro_hpa:.1f} hPa/{baro_inhg:.2f} inHg alt={altimeter_alt_ft:.0f}ft "
-        f"stdby={standby_baro_hpa:.1f} hPa/{standby_baro_inhg:.2f} inHg alt={standby_alt_ft:.0f}ft"
-    )
-
-    # G-force (normal)
-    g_force = clamp(read_float("sim/flightmodel2/misc/gforce_normal"), -8.0, 8.0)
-    g_units = int(g_force * 625.0)
-    _write_int(0x11BA, g_units, 2, signed=True)
-    _write_int(0x11B8, g_units, 2, signed=True)
+    if verbose:
+        log_verbose(f"BATTERY power={battery_on}")
 
     # Wind (ambient + surface layer)
-    ambient_speed_knots = clamp(read_float("sim/weather/aircraft/wind_now_speed_msc") * 1.943844, 0.0, 65535.0)
-    ambient_dir_true = read_float("sim/weather/aircraft/wind_now_direction_degt")
+    ambient_speed_knots = clamp(R.wind_speed() * 1.943844, 0.0, 65535.0)
+    ambient_dir_true = R.wind_dir()
     # Deprecated global arrays removed; rely on aircraft + region datarefs only
-    _write_u16(0x0E90, int(ambient_speed_knots + 0.5))
-    _write_u16(0x0E92, encode_direction16(ambient_dir_true))
-
-    surface_region_speed_arr = read_array_range("sim/weather/region/wind_speed_msc", 0, 1)
-    surface_region_dir_arr = read_array_range("sim/weather/region/wind_direction_degt", 0, 1)
-    surface_region_top_arr = read_array_range("sim/weather/region/wind_altitude_msl_m", 0, 1)
-    surface_region_dew_arr = read_array_range("sim/weather/region/dewpoint_deg_c", 0, 1)
-    surface_region_speed = first(surface_region_speed_arr, 0.0)
-    surface_region_dir = first(surface_region_dir_arr, 0.0)
-    surface_region_top_msl = first(surface_region_top_arr, 0.0)
-    surface_region_dew_c = first(surface_region_dew_arr, 0.0)
+    # 0x0E92 ist laut FSUIPC rechtweisend (True); nur die Bodenschicht unten (0x04DA/0x0EF2) ist missweisend
+    _write_block(_S_WIND, 0x0E90, int(ambient_speed_knots + 0.5), encode_direction16(ambient_dir_true))
+
+    R.wind_region_speed()
+    R.wind_region_dir()
+    R.wind_region_top()
+    R.wind_region_dew()
+    surface_region_speed = _BUF_WIND_REGION_SPEED[0]
+    surface_region_dir = _BUF_WIND_REGION_DIR[0]
+    surface_region_top_msl = _BUF_WIND_REGION_TOP[0]
+    surface_region_dew_c = _BUF_WIND_REGION_DEW[0]
     surface_region_speed_knots = surface_region_speed * 1.943844
     surface_speed_knots = clamp(surface_region_speed_knots if surface_region_speed > 0.0 else ambient_speed_knots, 0.0, 65535.0)
     surface_dir_true = surface_region_dir if surface_region_dir != 0.0 else ambient_dir_true
@@ -1233,11 +1603,9 @@ def update_snapshot() -> None:
     surface_dir_u16 = encode_direction16(surface_dir_mag)
     surface_ceiling_agl = max(0.0, surface_region_top_msl - ground_alt_m)
     _write_u16(0x04C8, int(clamp(surface_region_dew_c, -100.0, 100.0) * 256.0))
-    _write_u16(0x04D8, int(surface_speed_knots + 0.5))
-    _write_u16(0x04DA, surface_dir_u16)
-    _write_u16(0x0EEE, int(min(surface_ceiling_agl, 65535.0) + 0.5))
-    _write_u16(0x0EF0, int(surface_speed_knots + 0.5))
-    _write_u16(0x0EF2, surface_dir_u16)
+    surface_speed_u16 = int(surface_speed_knots + 0.5)
+    _write_block(_S_WIND, 0x04D8, surface_speed_u16, surface_dir_u16)
+    _write_block(_S_SURFACE_WIND, 0x0EEE, int(min(surface_ceiling_agl, 65535.0) + 0.5), surface_speed_u16, surface_dir_u16)
 
     # ---- Aircraft identification strings ----
     # FSUIPC offset definitions (from Pete Dowson FSUIPC SDK):
@@ -1248,11 +1616,11 @@ def update_snapshot() -> None:
     #   0x3148 (24 bytes)  - ATC airline name (e.g. "British Airways")
     #   0x313C (12 bytes)  - ATC ID / tail number (e.g. "G-EUYO")
     #   0x3160 (24 bytes)  - ATC type / manufacturer (e.g. "Airbus")
-    acf_icao = read_string("sim/aircraft/view/acf_ICAO", 40)
-    acf_descrip = read_string("sim/aircraft/view/acf_descrip", 260)
-    acf_tailnum = read_string("sim/aircraft/view/acf_tailnum", 40)
-    acf_livery = read_string("sim/aircraft/view/acf_livery_path", 260)
-    acf_path = read_string("sim/aircraft/view/acf_relative_path", 260)
+    acf_icao = R.acf_icao()
+    acf_descrip = R.acf_descrip()
+    acf_tailnum = R.acf_tailnum()
+    acf_livery = R.acf_livery()
+    acf_path = R.acf_path()
 
     # Build aircraft title for FSUIPC consumers (offset 0x3D00).
     # BAVirtual Merlin matches X-Plane aircraft by folder name + livery name in the title.
@@ -1291,7 +1659,7 @@ def update_snapshot() -> None:
     write_ascii(0x3D00, acf_title, 256)
     # 0x3E00: Simulator install path (256 bytes)
     # XPUIPC on Windows populates this with the X-Plane directory path.
-    xplane_path = read_string("sim/system/directory_path", 256)
+    xplane_path = R.xplane_path()
     write_ascii(0x3E00, xplane_path, 256)
     # 0x3500: ATC model (24 bytes) - ICAO type designator
     write_ascii(0x3500, acf_icao, 24)
@@ -1302,41 +1670,63 @@ def update_snapshot() -> None:
     # 0x3160: ATC type / manufacturer name (24 bytes)
     write_ascii(0x3160, acf_folder if acf_folder else acf_icao, 24)
 
-    log_verbose(f"AIRCRAFT icao={acf_icao!r} title={acf_title!r} folder={acf_folder!r} livery={livery_name!r}")
+    if verbose:
+        log_verbose(f"AIRCRAFT icao={acf_icao!r} title={acf_title!r} folder={acf_folder!r} livery={livery_name!r}")
 
 # parse FS6IPC block
 
-def parse_ipc_block(data: bytearray) -> bytearray:
-    update_snapshot()
+_IPC_HEADER = struct.Struct("<III")  # dwId, dwOffset, nBytes (READ hat danach noch pDest)
+
+def parse_ipc_block(
+    data: Union[bytearray, memoryview], image: Optional[bytes] = None
+) -> Optional[Union[bytearray, memoryview]]:
+    # image=None: Mainthread, READs direkt aus mem. Sonst: veröffentlichter Snapshot (Netzwerk-Thread),
+    # dann liefert ein WRITE None – der Block muss über die Queue in den Mainthread.
+    src = _MEM_VIEW if image is None else memoryview(image)
+    # auch das Ziel als memoryview: Slice-Zuweisung ist dann ein reines memcpy (und kann die Länge nie ändern)
+    dst = data if isinstance(data, memoryview) else memoryview(data)
     pos = 0
     end = len(data)
-    log_debug(f"parse_ipc_block size={end}")
+    debug = _DEBUG
+    read_id = FS6IPC_READSTATEDATA_ID
+    write_id = FS6IPC_WRITESTATEDATA_ID
+    mem_size = MEM_SIZE
+    unpack_header = _IPC_HEADER.unpack_from
+    if debug:
+        log_debug(f"parse_ipc_block size={end}")
     while pos + 4 <= end:
-        cmd = int.from_bytes(data[pos:pos+4], "little")
-        next_bytes = bytes_to_hex(data[pos:pos+16])
-        log_debug(f"  block cmd=0x{cmd:08X} pos=0x{pos:04X} next={next_bytes}")
+        if pos + 12 <= end:
+            cmd, dwOffset, nBytes = unpack_header(data, pos)
+        else:
+            cmd, = _S_U32.unpack_from(data, pos)
+        if debug:
+            log_debug(f"  block cmd=0x{cmd:08X} pos=0x{pos:04X} next={bytes_to_hex(data[pos:pos+16])}")
         if cmd == 0:
             break
-        if cmd == FS6IPC_READSTATEDATA_ID:
+        if cmd == read_id:
             if pos + 16 > end:
                 raise ValueError("READ header truncated")
-            dwOffset = int.from_bytes(data[pos+4:pos+8], "little")
-            nBytes = int.from_bytes(data[pos+8:pos+12], "little")
             payload = pos + 16
             if payload + nBytes > end:
                 raise ValueError("READ payload truncated")
-            data[payload:payload+nBytes] = mem[dwOffset:dwOffset+nBytes]
+            if dwOffset + nBytes <= mem_size:
+                dst[payload:payload+nBytes] = src[dwOffset:dwOffset+nBytes]
+            else:
+                # jenseits des Abbilds liefert FSUIPC Nullen
+                avail = max(0, mem_size - dwOffset)
+                dst[payload:payload+avail] = src[dwOffset:dwOffset+avail]
+                dst[payload+avail:payload+nBytes] = bytes(nBytes - avail)
             # Log what we return for aircraft identification offsets
-            if dwOffset in (0x3C00, 0x3D00, 0x3E00, 0x3500, 0x3148, 0x313C, 0x3160):
-                raw = mem[dwOffset:dwOffset+nBytes]
+            if debug and dwOffset in (0x3C00, 0x3D00, 0x3E00, 0x3500, 0x3148, 0x313C, 0x3160):
+                raw = bytes(src[dwOffset:dwOffset+nBytes])
                 text = raw.rstrip(b"\x00").decode("utf-8", errors="ignore")
                 log_debug(f"  IPC READ 0x{dwOffset:04X} ({nBytes}b) -> {text!r}")
             pos = payload + nBytes
-        elif cmd == FS6IPC_WRITESTATEDATA_ID:
+        elif cmd == write_id:
+            if image is not None:
+                return None
             if pos + 12 > end:
                 raise ValueError("WRITE header truncated")
-            dwOffset = int.from_bytes(data[pos+4:pos+8], "little")
-            nBytes = int.from_bytes(data[pos+8:pos+12], "little")
             payload = pos + 12
             if payload + nBytes > end:
                 raise ValueError("WRITE payload truncated")
@@ -1352,48 +1742,96 @@ FS6IPC_WRITESTATEDATA_ID = 2
 
 # ---------- Core IPC Handler (runs on main thread) ----------
 
-def handle_ipc(dwData: int, payload: bytes) -> Dict[str, Any]:
-    block = bytearray(payload)
+def handle_ipc(
+    dwData: int, payload: Union[bytes, bytearray, memoryview], image: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
+    # Binär-Frames liefern einen beschreibbaren View in den Empfangspuffer, der JSON-Pfad ein
+    # frisch dekodiertes bytearray – beides direkt in-place bearbeiten, nur bytes wird kopiert.
+    # Mit image (Netzwerk-Thread): None, wenn der Block WRITEs enthält und in den Mainthread muss.
+    block = payload if isinstance(payload, (bytearray, memoryview)) else bytearray(payload)
     try:
-        reply = parse_ipc_block(block)
+        reply = parse_ipc_block(block, image)
     except Exception as exc:
         log(f"parse error: {exc}")
-        log_debug(traceback.format_exc().strip())
+        if _DEBUG:
+            log_debug(traceback.format_exc().strip())
         return {"ok": False, "error": str(exc)}
-    return {"ok": True, "replyHex": bytes_to_hex(reply), "replyDwData": int(dwData)}
+    if reply is None:
+        return None
+    return {"ok": True, "reply": reply, "replyDwData": int(dwData)}
+
+
+def _decode_block(payload: Dict[str, Any]) -> bytearray:
+    # JSON-Pfad: "b64" bevorzugt, sonst "hex"
+    b64 = payload.get("b64")
+    if b64 is not None:
+        data = bytearray(binascii.a2b_base64(b64))
+    else:
+        data = hex_to_bytes(str(payload.get("hex", "")))
+    cb = int(payload.get("cbData", 0))
+    if cb and cb != len(data):
+        # Warnung, aber wir nehmen die tatsächliche Länge
+        log(f"cbData mismatch: cb={cb} len(data)={len(data)} – using len(data)")
+    return data
+
+
+def _try_serve_ipc(dwData: int, data: Union[bytearray, memoryview]) -> Optional[Dict[str, Any]]:
+    # READ-only Blöcke direkt im Netzwerk-Thread aus dem veröffentlichten Snapshot bedienen;
+    # None = (noch) kein Snapshot oder WRITE im Block → über die Queue
+    image = _published
+    if image is None:
+        return None
+    return handle_ipc(dwData, data, image)
 
 # ---------- FlightLoop (Mainthread executor) ----------
 
 def _flightloop_cb(elapsedSinceLastCall, elapsedTimeSinceLastFlightLoop, counter, refcon):
-    handled = 0
-    while handled < MAX_PER_TICK:
+    global _published, _snapshot_tick, _requests_applied
+    pending = REQ_QUEUE
+    # Snapshot einmal pro Tick statt pro Request; bei verbundenen Clients als unveränderliche
+    # Kopie veröffentlichen, aus der die Netzwerk-Threads READs ohne Mainthread bedienen
+    if pending or _client_count:
+        # erster Snapshot nach (Neu-)Verbindung immer vollständig
+        full = _published is None or _snapshot_tick == 0
+        _snapshot_tick = (_snapshot_tick + 1) % SLOW_FIELDS_EVERY
+        written = True
+        try:
+            written = update_snapshot(full)
+        except Exception as e:
+            log(f"snapshot error: {e}")
+            if _DEBUG:
+                log_debug(traceback.format_exc().strip())
+        # Kopie nur, wenn sich mem seit der letzten Veröffentlichung geändert haben kann
+        # (Snapshot geschrieben oder im letzten Tick Requests/WRITEs ausgeführt)
+        if _client_count and (written or _requests_applied or _published is None):
+            image = bytes(mem)
+            # unter dem Lock erneut prüfen: _track_client setzt _published beim letzten Disconnect auf None
+            with _CLIENT_LOCK:
+                if _client_count:
+                    _published = image
+    popleft = pending.popleft
+    applied = False
+    # höchstens MAX_PER_TICK pro Tick; leere Queue beendet die Schleife über IndexError
+    for _ in range(MAX_PER_TICK):
         try:
-            req: Request = REQ_QUEUE.get_nowait()
-        except Empty:
+            req: Request = popleft()
+        except IndexError:
             break
+        applied = True
         try:
-            p = req.payload
-            cmd = str(p.get("cmd", "")).strip().lower()
-            log_debug(f"dispatch cmd={cmd}")
-            if cmd == "ipc":
-                dw = int(p.get("dwData", 0))
-                cb = int(p.get("cbData", 0))
-                hexstr = str(p.get("hex", ""))
-                data = hex_to_bytes(hexstr)
-                if cb and cb != len(data):
-                    # Warnung, aber wir nehmen die tatsächliche Länge
-                    log(f"cbData mismatch: cb={cb} len(hex)={len(data)} – using len(hex)")
-                req.result = handle_ipc(dw, data)
-            else:
-                req.result = {"ok": False, "error": f"unknown cmd: {cmd}"}
+            if _DEBUG:
+                log_debug(f"dispatch ipc dwData={req.dwData} cbData={len(req.data)}")
+            req.result = handle_ipc(req.dwData, req.data)
         except Exception as e:
             log(f"dispatch error: {e}")
-            log_debug(traceback.format_exc().strip())
+            if _DEBUG:
+                log_debug(traceback.format_exc().strip())
             req.result = {"ok": False, "error": str(e)}
         finally:
             req.event.set()
-            handled += 1
-    return FLIGHTLOOP_INTERVAL
+    _requests_applied = applied
+    # Rest nach MAX_PER_TICK: schon im nächsten Frame weiter (negativ = Frames statt Sekunden)
+    return -1.0 if pending else FLIGHTLOOP_INTERVAL
 
 # ---------- TCP Server (Background thread) ----------
 
@@ -1444,57 +1882,275 @@ def _serve():
             _server_socket = None
 
 
+if orjson is not None:
+    def _json_loads(line: bytes) -> Any:
+        return orjson.loads(line)
+
+    def _json_line(obj: Dict[str, Any]) -> bytes:
+        # Antwortzeile inkl. "\n" in einem Aufruf
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    # ein Encoder für alle Antworten; json.dumps baut bei separators= jedes Mal einen neuen
+    _json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _json_loads(line: bytes) -> Any:
+        return json.loads(line.decode("utf-8"))
+
+    def _json_line(obj: Dict[str, Any]) -> bytes:
+        return (_json_encode(obj) + "\n").encode("utf-8")
+
+
+# IPC-Antwortzeile direkt als Bytes (identisch zur kompakten JSON-Ausgabe): Hex/Base64 bleiben
+# bytes, kein Umweg über str, dict und den Escape-Scan des Encoders
+_IPC_REPLY_LINE = b'{"ok":true,"%s":"%s","replyDwData":%d}\n'
+
+_FRAME_REQUEST = struct.Struct("<4sII")
+_FRAME_REPLY = struct.Struct("<4sIII")
+
+
 def _send_line(conn: socket.socket, obj: Dict[str, Any]) -> None:
-    line = json.dumps(obj, separators=(",", ":")) + "\n"
-    conn.sendall(line.encode("utf-8"))
+    conn.sendall(_json_line(obj))
+
+
+_IOV_MAX = 512  # konservativ unter dem POSIX-Minimum von 1024
+
+
+def _send_buffers(conn: socket.socket, buffers: List[bytes]) -> None:
+    # mehrere Antworten mit einem sendmsg/writev; Windows hat kein sendmsg → join
+    if not buffers:
+        return
+    if len(buffers) == 1:
+        conn.sendall(buffers[0])
+        return
+    if not hasattr(conn, "sendmsg") or len(buffers) > _IOV_MAX:
+        conn.sendall(b"".join(buffers))
+        return
+    sent = conn.sendmsg(buffers)
+    if sent < sum(len(b) for b in buffers):
+        conn.sendall(b"".join(buffers)[sent:])
+
+
+def _send_frame(conn: socket.socket, status: int, dwData: int, data: bytes) -> None:
+    # data darf ein memoryview sein (Antwort liegt noch im Empfangspuffer) – Header + Block ohne Kopie
+    _send_buffers(conn, [_FRAME_REPLY.pack(FRAME_MAGIC, status, dwData & 0xFFFFFFFF, len(data)), data])
 
 
 def _handle_client(conn: socket.socket, addr):
-    conn.settimeout(60)
     with conn:
-        buf = b""
-        log(f"client {addr} connected")
-        _show_toast(f"wineUIPC connected {addr[0]} -> {HOST}:{PORT}")
+        framed = False
         try:
-            while True:
-                chunk = conn.recv(4096)
-                if not chunk:
-                    return
-                buf += chunk
-                while b"\n" in buf:
-                    line, buf = buf.split(b"\n", 1)
-                    _process_line(conn, line)
+            # Zähler innerhalb von try/finally: auch ein Fehler in setsockopt/recv gibt ihn wieder frei
+            _track_client(1)
+            conn.settimeout(60)
+            # kleine Request/Reply-Pakete: Nagle + Delayed-ACK würde jede Antwort um bis zu ~40 ms verzögern
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_BYTES)
+            log(f"client {addr} connected")
+            _show_toast(f"wineUIPC connected {addr[0]} -> {HOST}:{PORT}")
+            head = conn.recv(1, socket.MSG_PEEK)
+            if not head:
+                return
+            framed = head == FRAME_MAGIC[:1]
+            if framed:
+                _serve_frames(conn)
+            else:
+                _serve_lines(conn)
         except socket.timeout:
             return
         except Exception as e:
             try:
-                _send_line(conn, {"ok": False, "error": str(e)})
+                if framed:
+                    _send_frame(conn, 1, 0, str(e).encode("utf-8"))
+                else:
+                    _send_line(conn, {"ok": False, "error": str(e)})
             except Exception:
                 pass
             return
         finally:
+            _track_client(-1)
             log(f"client {addr} disconnected")
 
 
-def _process_line(conn: socket.socket, line: bytes) -> None:
-    try:
-        payload = json.loads(line.decode("utf-8"))
-    except Exception as e:
-        _send_line(conn, {"ok": False, "error": f"invalid json: {e}"})
-        return
+def _track_client(delta: int) -> None:
+    global _client_count, _published
+    with _CLIENT_LOCK:
+        _client_count += delta
+        if _client_count <= 0:
+            _client_count = 0
+            # ohne Clients veröffentlicht der Flightloop nicht mehr – alten Snapshot nicht weiterreichen
+            _published = None
 
-    log_debug(f"recv payload keys={list(payload.keys())}")
 
-    ev = threading.Event()
-    req = Request(payload=payload, event=ev)
-    REQ_QUEUE.put(req)
+def _serve_lines(conn: socket.socket) -> None:
+    # große recv-Blöcke in einen bytearray sammeln; nur neu empfangene Bytes nach "\n" durchsuchen
+    buf = bytearray()
+    while True:
+        chunk = conn.recv(RECV_BUFFER_BYTES)
+        if not chunk:
+            return
+        start = len(buf)
+        buf += chunk
+        if buf.find(b"\n", start) < 0:
+            continue
+        # alle vollständigen Zeilen dieses recv gemeinsam einreihen und beantworten; ein split über
+        # den ganzen Puffer, das letzte Stück (unvollständige Zeile) ist der neue Puffer
+        lines = buf.split(b"\n")
+        buf = lines.pop()
+        _process_lines(conn, lines)
+
+
+def _serve_frames(conn: socket.socket) -> None:
+    # ein Empfangspuffer pro Verbindung: recv_into füllt ihn, Frames werden in-place
+    # zerlegt und als memoryview (ohne Kopie) an den Mainthread gegeben
+    buf = bytearray(RECV_BUFFER_BYTES)
+    view = memoryview(buf)
+    end = 0
+    header_size = _FRAME_REQUEST.size
+    replies: List[Any] = []
+    while True:
+        got = conn.recv_into(view[end:])
+        if not got:
+            return
+        end += got
+        pos = 0
+        need = header_size
+        while end - pos >= header_size:
+            magic, dw, cb = _FRAME_REQUEST.unpack_from(buf, pos)
+            if magic != FRAME_MAGIC or cb > MAX_FRAME_BYTES:
+                _flush_frames(conn, replies)  # bereits beantwortete Frames noch ausliefern
+                if magic != FRAME_MAGIC:
+                    raise ValueError(f"bad frame magic {bytes(magic)!r}")
+                raise ValueError(f"frame too large: {cb} bytes")
+            need = header_size + cb
+            if end - pos < need:
+                break
+            owned = _process_frame(conn, dw, view[pos + header_size:pos + need], replies)
+            pos += need
+            need = header_size
+            if not owned:
+                # Timeout: der Mainthread hält evtl. noch einen View und schreibt später hinein –
+                # alten Puffer aufgeben, Rest in einen neuen übernehmen
+                fresh = bytearray(len(buf))
+                fresh[:end - pos] = buf[pos:end]
+                buf = fresh
+                view = memoryview(buf)
+                end -= pos
+                pos = 0
+        # Antworten aus diesem recv mit einem Syscall; sie zeigen evtl. noch in den Puffer
+        _flush_frames(conn, replies)
+        if pos:
+            # Rest nach vorne schieben (gleiche Länge → kein Resize trotz exportierter Views)
+            buf[:end - pos] = buf[pos:end]
+            end -= pos
+        if need > len(buf):
+            grown = bytearray(max(need, len(buf) * 2))
+            grown[:end] = buf[:end]
+            buf = grown
+            view = memoryview(buf)
+
+
+def _enqueue(dwData: int, data: Union[bytearray, memoryview]) -> Request:
+    req = Request(dwData=dwData, data=data, event=_acquire_event())
+    REQ_QUEUE.append(req)
+    return req
+
+
+def _await(req: Request, timeout: float = REPLY_TIMEOUT) -> Optional[Dict[str, Any]]:
+    # wartet auf den Mainthread; None = Timeout
+    if not req.event.wait(timeout=max(0.0, timeout)):
+        # Event nicht zurücklegen: der Mainthread könnte es noch nachträglich setzen
+        return None
+    _release_event(req.event)
+    return req.result or {"ok": False, "error": "no result"}
 
-    if not ev.wait(timeout=REPLY_TIMEOUT):
-        log(f"ipc timeout cmd={payload.get('cmd')} dwData={payload.get('dwData')} cbData={payload.get('cbData')} keys={list(payload.keys())}")
-        _send_line(conn, {"ok": False, "error": "timeout"})
-        return
 
-    _send_line(conn, req.result or {"ok": False, "error": "no result"})
+def _submit(dwData: int, data: Union[bytearray, memoryview]) -> Optional[Dict[str, Any]]:
+    return _await(_enqueue(dwData, data))
+
+
+def _process_frame(conn: socket.socket, dwData: int, data: memoryview, out: List[Any]) -> bool:
+    # False = Timeout, der Empfangspuffer hinter data darf nicht wiederverwendet werden
+    # Antworten sammeln sich in out und gehen gemeinsam raus; vor dem Warten auf den Mainthread leeren
+    result = _try_serve_ipc(dwData, data)
+    if result is None:
+        _flush_frames(conn, out)
+        result = _submit(dwData, data)
+    if result is None:
+        log(f"ipc timeout (frame) dwData={dwData} cbData={len(data)}")
+        _queue_frame(out, 1, dwData, b"timeout")
+        return False
+    if not result.get("ok"):
+        _queue_frame(out, 1, dwData, str(result.get("error", "")).encode("utf-8"))
+        return True
+    _queue_frame(out, 0, int(result.get("replyDwData", dwData)), result["reply"])
+    return True
+
+
+def _queue_frame(out: List[Any], status: int, dwData: int, data: bytes) -> None:
+    out.append(_FRAME_REPLY.pack(FRAME_MAGIC, status, dwData & 0xFFFFFFFF, len(data)))
+    out.append(data)
+
+
+def _flush_frames(conn: socket.socket, out: List[Any]) -> None:
+    if out:
+        _send_buffers(conn, out)
+        out.clear()
+
+
+def _process_lines(conn: socket.socket, lines: List[bytes]) -> None:
+    # erst alle Requests einreihen, dann gesammelt warten und mit einem Syscall antworten
+    # Einträge: (payload, Request) wartet auf den Mainthread, (payload, dict) ist schon fertig
+    entries: List[Tuple[Optional[Dict[str, Any]], Any]] = []
+    for line in lines:
+        try:
+            payload = _json_loads(line)
+        except Exception as e:
+            entries.append((None, {"ok": False, "error": f"invalid json: {e}"}))
+            continue
+        # vor dem Debug-Log prüfen: [1,2], 123 oder "x" sind gültiges JSON, haben aber kein keys()
+        if not isinstance(payload, dict):
+            entries.append((None, {"ok": False, "error": "invalid request: expected a JSON object"}))
+            continue
+        if _DEBUG:
+            log_debug(f"recv payload keys={list(payload.keys())}")
+        cmd = payload.get("cmd")
+        if cmd != "ipc":  # übliche JSON-Requests schicken genau "ipc"
+            cmd = str(payload.get("cmd", "")).strip().lower()
+        if cmd != "ipc":
+            entries.append((payload, {"ok": False, "error": f"unknown cmd: {cmd}"}))
+            continue
+        try:
+            data = _decode_block(payload)
+            dwData = int(payload.get("dwData", 0))
+        except Exception as e:
+            entries.append((payload, {"ok": False, "error": str(e)}))
+            continue
+        result = _try_serve_ipc(dwData, data)
+        if result is None:
+            result = _enqueue(dwData, data)
+        entries.append((payload, result))
+
+    deadline = time.monotonic() + REPLY_TIMEOUT
+    replies: List[bytes] = []
+    for payload, pending in entries:
+        if payload is None:
+            replies.append(_json_line(pending))
+            continue
+        if isinstance(pending, Request):
+            result = _await(pending, deadline - time.monotonic())
+        else:
+            result = pending
+        if result is None:
+            log(f"ipc timeout cmd={payload.get('cmd')} dwData={payload.get('dwData')} cbData={payload.get('cbData')} keys={list(payload.keys())}")
+            result = {"ok": False, "error": "timeout"}
+        elif "reply" in result:
+            if payload.get("b64") is not None:  # wie _decode_block
+                replies.append(_IPC_REPLY_LINE % (b"replyB64", binascii.b2a_base64(result["reply"], newline=False), result["replyDwData"]))
+            else:
+                replies.append(_IPC_REPLY_LINE % (b"replyHex", binascii.hexlify(result["reply"]).upper(), result["replyDwData"]))
+            continue
+        replies.append(_json_line(result))
+    _send_buffers(conn, replies)
 
 # ---------- Plugin Lifecycle ----------
 _server_thread: Optional[threading.Thread] = None
@@ -1507,6 +2163,7 @@ _last_on_ground = 0
 _landing_rate_raw = 0
 _landing_rate_frozen = False
 _handshake_logged = False
+_paused_snapshot_done = False  # schneller Teil wurde seit Beginn der Pause schon einmal geschrieben
 
 
 def XPluginStart():
@@ -1528,10 +2185,12 @@ def XPluginStop():
         except Exception:
             pass
         _toast_draw_registered = False
+    _close_log()
 
 
 def XPluginEnable():
     global _server_thread
+    _bind_datarefs()
     if _server_thread and _server_thread.is_alive():
         log_debug("server thread already running, skipping restart")
     else:
@@ -1542,6 +2201,13 @@ def XPluginEnable():
     return 1
 
 
+def XPluginReceiveMessage(inFromWho, inMessage, inParam):
+    # Flugzeugwechsel (inParam 0 = eigenes Flugzeug): Addon-DataRefs kommen und gehen mit dem Flugzeug
+    if inMessage == xp.MSG_PLANE_LOADED and not inParam:
+        _bind_fallback_datarefs()
+        log_verbose("plane loaded, fallback/cabin sign/radio datarefs re-resolved")
+
+
 def XPluginDisable():
     global _server_socket, _server_thread
     _server_stop.set()